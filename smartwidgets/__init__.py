@@ -1,9 +1,166 @@
-from dearpygui import core as dpg
-
-from smartwidgets.bases import _smartitems, smartitem
-from smartwidgets.containers import *
-from smartwidgets.node import *
-from smartwidgets.inputs import *
-from smartwidgets.buttons import *
-from smartwidgets.widgets import *
-from smartwidgets.vss import ValueStorageProxy
+"""
+Submodules (and the items they define) are imported on first use, so
+importing smartwidgets only loads what's used. dearpygui itself is imported
+by the backend when the first dearpygui call is made (see <backend>).
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+from smartwidgets.backend import core as dpg, get_backend, set_backend
+
+from smartwidgets.bases import (
+    _smartitems,
+    smartitem,
+    snapshot,
+    on_frame,
+    off_frame,
+    run_frame,
+    set_write_back,
+    write_back,
+    flush,
+    write_back_stats,
+    sync_states,
+    reserve_ids,
+    set_weak_registry,
+    registry_report,
+    ItemState,
+    ConfigProperty,
+    SmartDependant,
+    compact,
+    set_deferred,
+    deferred,
+    realize,
+    delete_many,
+    verify_tree,
+)
+
+if TYPE_CHECKING:
+    from smartwidgets.containers import *
+    from smartwidgets.node import *
+    from smartwidgets.inputs import *
+    from smartwidgets.buttons import *
+    from smartwidgets.widgets import *
+    from smartwidgets.vss import ValueStorageProxy
+    from smartwidgets.arrays import ArrayBinding
+
+
+# {"name": "submodule"} of the names imported on first use
+_LAZY = {
+    **dict.fromkeys(
+        [
+            "Window",
+            "Child",
+            "VirtualList",
+            "Group",
+            "MenuBar",
+            "Menu",
+            "TabBar",
+            "Tab",
+            "Popup",
+            "Tooltip",
+            "TreeNode",
+            "ManagedColumns",
+        ],
+        "containers",
+    ),
+    **dict.fromkeys(["NodeEditor", "Node", "NodeAttribute"], "node"),
+    **dict.fromkeys(
+        [
+            "InputInt4",
+            "InputInt3",
+            "InputInt2",
+            "InputInt",
+            "InputFloat4",
+            "InputFloat3",
+            "InputFloat2",
+            "InputFloat",
+            "InputText",
+            "DragInt4",
+            "DragInt3",
+            "DragInt2",
+            "DragInt",
+            "DragFloat4",
+            "DragFloat3",
+            "DragFloat2",
+            "DragFloat",
+            "SliderInt4",
+            "SliderInt3",
+            "SliderInt2",
+            "SliderInt",
+            "SliderFloat4",
+            "SliderFloat3",
+            "SliderFloat2",
+            "SliderFloat",
+        ],
+        "inputs",
+    ),
+    "Button": "buttons",
+    "Text": "widgets",
+    "ValueStorageProxy": "vss",
+    "ArrayBinding": "arrays",
+}
+
+_SUBMODULES = {
+    "aio",
+    "arrays",
+    "backend",
+    "bases",
+    "bench",
+    "buttons",
+    "containers",
+    "executor",
+    "inputs",
+    "instrument",
+    "layout",
+    "node",
+    "reconciler",
+    "threads",
+    "vss",
+    "widgets",
+}
+
+__all__ = [
+    "dpg",
+    "get_backend",
+    "set_backend",
+    "smartitem",
+    "snapshot",
+    "on_frame",
+    "off_frame",
+    "run_frame",
+    "set_write_back",
+    "write_back",
+    "flush",
+    "write_back_stats",
+    "sync_states",
+    "reserve_ids",
+    "set_weak_registry",
+    "registry_report",
+    "ItemState",
+    "ConfigProperty",
+    "SmartDependant",
+    "compact",
+    "set_deferred",
+    "deferred",
+    "realize",
+    "delete_many",
+    "verify_tree",
+    *_LAZY,
+]
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY[name]}"), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # skips __getattr__ next time
+
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -0,0 +1,76 @@
+"""
+asyncio integration.
+
+<run> (or <Window.start_async>) renders dearpygui frames from a running asyncio
+event loop, yielding to the loop between frames, so UI and asyncio services
+can share a process. Callbacks that are coroutine functions are scheduled as
+tasks on that loop instead of blocking the frame.
+
+    async def main():
+        await asyncio.gather(window.start_async(), serve())
+"""
+import time
+import asyncio
+import functools
+from typing import Callable
+
+from .backend import core as dpg
+from .bases import run_frame
+
+
+__all__ = [
+    "run",
+    "coroutine_callback",
+]
+
+
+_loop: asyncio.AbstractEventLoop = None
+_tasks = set()  # keeps scheduled callbacks alive until they're done
+
+
+async def run(window, *, frame_budget: float = 0.002):
+    """
+    Coroutine. Starts dearpygui with <window> (a Window or its id) as the 
+    primary window, and renders frames until dearpygui stops. Callbacks 
+    registered with <on_frame> are run before each frame.
+
+    Parameters:
+        frame_budget: Time (in seconds) given to the event loop after each 
+        frame. Pending asyncio work runs at least once per frame, and the 
+        loop is never given more than this (unless a task doesn't yield).
+    """
+    global _loop
+    _loop = asyncio.get_running_loop()
+
+    dpg.set_primary_window(str(window), True)
+    dpg.setup_dearpygui()
+    try:
+        while dpg.is_dearpygui_running():
+            run_frame()
+            dpg.render_dearpygui_frame()
+
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            if (remaining := frame_budget - (time.perf_counter() - start)) > 0:
+                await asyncio.sleep(remaining)
+    finally:
+        dpg.cleanup_dearpygui()
+        _loop = None
+
+
+def coroutine_callback(callback: Callable):
+    """Wraps a coroutine function so it can be used as a dearpygui callback.
+    When called, the coroutine is scheduled on the loop running <run>. If
+    no loop is running, it is run to completion instead. Callbacks set on 
+    items are wrapped automatically."""
+
+    @functools.wraps(callback)
+    def schedule(sender, data):
+        if _loop is None:
+            return asyncio.run(callback(sender, data))
+
+        task = _loop.create_task(callback(sender, data))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+    return schedule
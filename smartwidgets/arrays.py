@@ -0,0 +1,116 @@
+"""
+Binding the values of many items to one NumPy array (requires NumPy).
+
+<ArrayBinding> ties row i of an (n, k) array to the value of item i, where
+the items are vector inputs, drags or sliders holding k numbers (or scalar
+ones, for an (n,) array):
+
+    rows = [DragFloat3(parent=window).add() for _ in range(500)]
+    binding = ArrayBinding(rows)
+
+    def frame():
+        binding.array[:] = simulation.positions
+        binding.push()  # only sets the values of rows that changed
+
+    on_frame(frame)
+
+<push> compares the array to the values last sent to (or read from)
+dearpygui in one vectorized pass, so the number of dearpygui calls made
+scales with the number of changed rows instead of the number of items.
+<pull> reads every items' value back into the array at once.
+"""
+from typing import Union
+
+from .backend import core as dpg
+from .bases import SmartObject
+
+
+__all__ = [
+    "ArrayBinding",
+]
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required to bind item values to arrays.") from None
+
+    return numpy
+
+
+class ArrayBinding:
+    """
+    The values of <items> (SmartObjects or ids), bound to the rows of an
+    array.
+
+    Parameters:
+
+        items: The bound items, in row order.
+
+        array: An (n, k) array (or (n,) for items holding one number) with a
+        row per item. Used as is (not copied), so it can be shared with the
+        code producing the values. If None, an array of floats is created 
+        from the items' current values (read in one pass, as by <pull>).
+
+    Attributes:
+
+        array: The bound array. Changes to it are sent to dearpygui by <push>.
+    """
+
+    def __init__(self, items: list[Union[str, SmartObject]], array=None):
+        np = _numpy()
+
+        self._ids = [str(item) for item in items]
+        if array is None:
+            get_value = dpg.get_value
+            array = np.array([get_value(id) for id in self._ids], dtype=float)
+            synced = array.copy()
+        elif len(array) != len(self._ids):
+            raise ValueError(f"{len(self._ids)} items can't be bound to {len(array)} rows.")
+        else:
+            synced = np.full_like(array, np.nan, dtype=float)  # not known yet
+
+        self.array = array
+        # the values dearpygui holds, as of the last <push> or <pull>
+        self._synced = synced
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(items={len(self)}, shape={self.array.shape})"
+
+    def changed(self):
+        """Returns the indices of the rows that have changed since the last
+        <push> or <pull>."""
+        np = _numpy()
+        diff = self.array != self._synced
+        if diff.ndim > 1:
+            diff = diff.any(axis=tuple(range(1, diff.ndim)))
+
+        return np.flatnonzero(diff)
+
+    def push(self, rows=None):
+        """Sets the value of each item whose row changed since the last <push>
+        or <pull> (every row the first time, if the array was passed in). If 
+        <rows> (indices) are passed, only those are sent, without comparing 
+        the others. Returns the number of items updated."""
+        rows = self.changed() if rows is None else _numpy().asarray(rows, dtype=int)
+        if not len(rows):
+            return 0
+
+        ids, array, set_value = self._ids, self.array, dpg.set_value
+        for row in rows.tolist():
+            set_value(ids[row], array[row].tolist())
+        self._synced[rows] = array[rows]
+
+        return len(rows)
+
+    def pull(self):
+        """Reads the value of every item into the array. Returns the array."""
+        get_value = dpg.get_value
+        self.array[...] = [get_value(id) for id in self._ids]
+        self._synced[...] = self.array
+
+        return self.array
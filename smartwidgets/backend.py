@@ -0,0 +1,437 @@
+"""
+Backends that smartwidgets calls into.
+
+Every dearpygui call made by smartwidgets goes through <core>, a stand-in for
+<dearpygui.core> that forwards each call to the current backend. By default
+that's <DearPyGuiBackend>. <HeadlessBackend> models dearpygui 0.6 in pure
+Python, so widgets can be built, configured and deleted without a GPU context.
+Set the SMARTWIDGETS_BACKEND environment variable to "headless" to use it by
+default, or call <set_backend>.
+"""
+import os
+import time
+from functools import partial
+from typing import Any, Callable
+
+
+__all__ = [
+    "Backend",
+    "DearPyGuiBackend",
+    "HeadlessBackend",
+    "core",
+    "get_backend",
+    "set_backend",
+]
+
+
+class Backend:
+    """
+    Base class for backends. A backend provides the functions smartwidgets
+    calls, with the same names and signatures as in <dearpygui.core> (i.e. 
+    add_button, configure_item, get_value, etc.).
+    """
+
+    name: str = None
+
+
+class DearPyGuiBackend(Backend):
+    """Forwards every call to <dearpygui.core>, which is imported on first use."""
+
+    name = "dearpygui"
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        from dearpygui import core
+
+        func = getattr(core, name)
+        setattr(self, name, func)  # skips __getattr__ next time
+
+        return func
+
+
+class _HeadlessItem:
+    __slots__ = ("type", "config", "parent", "children", "callback", "callback_data")
+
+    def __init__(self, type, config, parent, callback, callback_data):
+        self.type = type
+        self.config = config
+        self.parent = parent
+        self.children = []
+        self.callback = callback
+        self.callback_data = callback_data
+
+
+class HeadlessBackend(Backend):
+    """
+    Pure-Python stand-in for dearpygui 0.6. Models the item tree (parents, 
+    children and their order), item configurations, callbacks, the container 
+    stack and value storage. Nothing is drawn; "frames" only run the render 
+    callback.
+
+    Parameters:
+        max_frames: If provided, <start_dearpygui> stops after rendering
+        this many frames. Otherwise it runs until <stop_dearpygui> is called.
+    """
+
+    name = "headless"
+
+    # add_* commands that start a parent stack
+    CONTAINERS = {
+        "window",
+        "child",
+        "group",
+        "menu_bar",
+        "menu",
+        "tab_bar",
+        "tab",
+        "popup",
+        "tooltip",
+        "tree_node",
+        "collapsing_header",
+        "managed_columns",
+        "node_editor",
+        "node",
+        "node_attribute",
+    }
+
+    # height (in pixels) of items without one, for scrolling
+    LINE_HEIGHT = 17
+
+    def __init__(self, max_frames: int = None):
+        self.max_frames = max_frames
+        self.reset()
+
+    def reset(self):
+        """Removes every item and value, and stops the render loop."""
+        self.items = {}  # {"item name": _HeadlessItem}
+        self.values = {}  # value storage
+        self.stack = []  # container stack
+        self.column_widths = {}  # {("item name", column): width}
+        self.scroll = {}  # {"item name": [x, y]}
+        self.render_callback = None
+        self.primary_window = ""
+        self.frame_count = 0
+        self.running = False
+        self._start_time = time.perf_counter()
+        self._frame_time = self._start_time
+        self._delta_time = 0.0
+
+    def __getattr__(self, name: str):
+        if name.startswith("add_"):
+            func = partial(self._add, name[4:])
+            setattr(self, name, func)
+            return func
+
+        raise AttributeError(f"<{self.__class__.__name__}> does not support '{name}'.")
+
+    def _item(self, name: str):
+        try:
+            return self.items[name]
+        except KeyError:
+            raise Exception(f"Item '{name}' does not exist.") from None
+
+    def _insert(self, name: str, parent: str, before: str):
+        siblings = self._item(parent).children
+        if before:
+            siblings.insert(siblings.index(before), name)
+        else:
+            siblings.append(name)
+
+    # items
+    def _add(
+        self, 
+        type: str, 
+        name: str, 
+        *, 
+        parent: str = "", 
+        before: str = "",
+        callback: Callable = None,
+        callback_data: Any = None,
+        source: str = "",
+        default_value: Any = None,
+        **config,
+        ):
+        if name in self.items:
+            raise Exception(f"Item '{name}' already exists.")
+
+        if type == "window":
+            parent = ""
+        elif not (parent := parent or (self.stack[-1] if self.stack else "")):
+            raise Exception(f"Item '{name}' needs a parent.")
+
+        config.setdefault("label", name)
+        config["source"] = source
+
+        self.items[name] = _HeadlessItem(type, config, parent, callback, callback_data)
+        if parent:
+            self._insert(name, parent, before)
+
+        if default_value is not None:
+            self.values.setdefault(source or name, default_value)
+
+        if type in self.CONTAINERS:
+            self.stack.append(name)
+
+    def end(self):
+        self.stack.pop()
+
+    def does_item_exist(self, item: str):
+        return item in self.items
+
+    def get_item_type(self, item: str):
+        return f"mvAppItemType::{self._item(item).type}"
+
+    def configure_item(self, item: str, **config):
+        self._item(item).config.update(config)
+
+    def get_item_configuration(self, item: str):
+        return {"name": item, **self._item(item).config}
+
+    def delete_item(self, item: str, *, children_only: bool = False):
+        target = self._item(item)
+
+        pending = [*target.children]
+        while pending:
+            child = self.items.pop(pending.pop())
+            pending.extend(child.children)
+
+        target.children = []
+        if not children_only:
+            if target.parent:
+                self.items[target.parent].children.remove(item)
+            del self.items[item]
+
+    def get_item_children(self, item: str):
+        return [*self._item(item).children]
+
+    def get_item_parent(self, item: str):
+        return self._item(item).parent
+
+    def get_windows(self):
+        return [name for name, item in self.items.items() if item.type == "window"]
+
+    def get_all_items(self):
+        return [*self.items]
+
+    def is_item_container(self, item: str):
+        return self._item(item).type in self.CONTAINERS
+
+    def is_item_activated(self, item: str):
+        return False
+
+    def is_item_focused(self, item: str):
+        return False
+
+    def is_item_hovered(self, item: str):
+        return False
+
+    def is_item_visible(self, item: str):
+        return self._item(item).config.get("show", True)
+
+    def is_item_clicked(self, item: str):
+        return False
+
+    def is_item_edited(self, item: str):
+        return False
+
+    def move_item(self, item: str, *, parent: str = "", before: str = ""):
+        target = self._item(item)
+        self.items[target.parent].children.remove(item)
+
+        target.parent = parent or target.parent
+        self._insert(item, target.parent, before)
+
+    def move_item_up(self, item: str):
+        siblings = self.items[self._item(item).parent].children
+        if (index := siblings.index(item)):
+            siblings[index - 1], siblings[index] = siblings[index], siblings[index - 1]
+
+    def move_item_down(self, item: str):
+        siblings = self.items[self._item(item).parent].children
+        if (index := siblings.index(item)) < len(siblings) - 1:
+            siblings[index + 1], siblings[index] = siblings[index], siblings[index + 1]
+
+    # callbacks
+    def set_item_callback(self, item: str, callback: Callable, *, callback_data: Any = None):
+        target = self._item(item)
+        target.callback = callback
+        target.callback_data = callback_data
+
+    def get_item_callback(self, item: str):
+        return self._item(item).callback
+
+    def set_item_callback_data(self, item: str, callback_data: Any):
+        self._item(item).callback_data = callback_data
+
+    def get_item_callback_data(self, item: str):
+        return self._item(item).callback_data
+
+    def trigger(self, item: str, data: Any = None):
+        """Calls the items' callback the way dearpygui would when the item
+        is interacted with. <data> defaults to the items' callback data."""
+        target = self._item(item)
+        if target.callback is not None:
+            target.callback(item, target.callback_data if data is None else data)
+
+    # value storage
+    def add_value(self, name: str, value: Any):
+        self.values[name] = value
+
+    def get_value(self, name: str):
+        if name in self.items:
+            name = self.items[name].config.get("source") or name
+
+        return self.values.get(name)
+
+    def set_value(self, name: str, value: Any):
+        if name in self.items:
+            name = self.items[name].config.get("source") or name
+
+        self.values[name] = value
+        return True
+
+    # managed columns
+    def get_managed_column_width(self, item: str, column: int):
+        self._item(item)
+        return self.column_widths.get((item, column), 0.0)
+
+    def set_managed_column_width(self, item: str, column: int, width: float):
+        self._item(item)
+        self.column_widths[(item, column)] = width
+
+    # scrolling
+    def _content_size(self, item: str):
+        # children are stacked vertically; ones without a height are
+        # assumed to be one line of text
+        width = height = 0
+        for child in self._item(item).children:
+            config = self.items[child].config
+            if config.get("show", True):
+                width = max(width, config.get("width") or 0)
+                height += config.get("height", self.LINE_HEIGHT)
+        return width, height
+
+    def get_x_scroll(self, item: str):
+        return self.scroll.get(item, (0.0, 0.0))[0]
+
+    def get_y_scroll(self, item: str):
+        return self.scroll.get(item, (0.0, 0.0))[1]
+
+    def set_x_scroll(self, item: str, value: float):
+        value = min(max(float(value), 0.0), self.get_x_scroll_max(item))
+        self.scroll[item] = [value, self.get_y_scroll(item)]
+
+    def set_y_scroll(self, item: str, value: float):
+        value = min(max(float(value), 0.0), self.get_y_scroll_max(item))
+        self.scroll[item] = [self.get_x_scroll(item), value]
+
+    def get_x_scroll_max(self, item: str):
+        width = self._content_size(item)[0] - (self._item(item).config.get("width") or 0)
+        return float(max(width, 0))
+
+    def get_y_scroll_max(self, item: str):
+        height = self._content_size(item)[1] - (self._item(item).config.get("height") or 0)
+        return float(max(height, 0))
+
+    # render loop
+    def set_render_callback(self, callback: Callable, *, handler: str = ""):
+        self.render_callback = callback
+
+    def set_primary_window(self, window: str, value: bool):
+        self.primary_window = window if value else ""
+
+    def setup_dearpygui(self):
+        self.running = True
+
+    def is_dearpygui_running(self):
+        if self.max_frames is not None and self.frame_count >= self.max_frames:
+            return False
+
+        return self.running
+
+    def render_dearpygui_frame(self):
+        now = time.perf_counter()
+        self._delta_time, self._frame_time = now - self._frame_time, now
+        self.frame_count += 1
+
+        if self.render_callback is not None:
+            self.render_callback("", None)
+
+    def cleanup_dearpygui(self):
+        self.running = False
+
+    def start_dearpygui(self, *, primary_window: str = ""):
+        if primary_window:
+            self.set_primary_window(primary_window, True)
+
+        self.setup_dearpygui()
+        while self.is_dearpygui_running():
+            self.render_dearpygui_frame()
+        self.cleanup_dearpygui()
+
+    def stop_dearpygui(self):
+        self.running = False
+
+    def get_total_time(self):
+        return time.perf_counter() - self._start_time
+
+    def get_delta_time(self):
+        return self._delta_time
+
+
+class _Command:
+    # forwards a call to the current backend
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        return getattr(_backend, self.name)(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<smartwidgets command '{self.name}'>"
+
+
+class _Core:
+    """Stand-in for <dearpygui.core>. Its functions call into the current 
+    backend, so they can be bound (i.e. <SmartObject._func>) before a backend 
+    is chosen. Constants (mvKey_A, mvGuiCol_Text, etc.) are read from the 
+    current backend as they are."""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name.startswith("mv"):
+            # not cached, since it's the backends' value
+            return getattr(_backend, name)
+
+        command = _Command(name)
+        setattr(self, name, command)
+
+        return command
+
+
+core = _Core()
+
+_backend: Backend = (
+    HeadlessBackend() 
+    if os.environ.get("SMARTWIDGETS_BACKEND", "").lower() == "headless" 
+    else DearPyGuiBackend()
+)
+
+
+def get_backend():
+    """Returns the current backend."""
+    return _backend
+
+
+def set_backend(backend: Backend):
+    """Sets the backend that all smartwidgets calls go through. Returns the 
+    previous backend."""
+    global _backend
+    previous, _backend = _backend, backend
+
+    return previous
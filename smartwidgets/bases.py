@@ -1,21 +1,179 @@
 from __future__ import annotations
 
+import sys
+import weakref
+import threading
 from typing import Union, Callable
+from contextlib import contextmanager
+from enum import IntEnum
+from operator import attrgetter, itemgetter
+from collections.abc import MutableMapping
 
-from dearpygui.core import *
+from .backend import core as dpg
 
 
 __all__ = [
     "SMARTITEMS",
     "smartitem",
+    "snapshot",
+    "on_frame",
+    "off_frame",
+    "run_frame",
+    "set_write_back",
+    "write_back",
+    "flush",
+    "write_back_stats",
+    "sync_states",
+    "reserve_ids",
+    "set_weak_registry",
+    "registry_report",
+    "ItemState",
     "ConfigProperty",
+    "compact",
+    "set_deferred",
+    "deferred",
+    "realize",
+    "delete_many",
+    "verify_tree",
     "SmartObject",
     "SmartDependant",
 ]
 
 
-_smartitems = {}  # {"item string name": SmartObject}
-_smartconfig = {}
+class _ItemRef(weakref.ref):
+    # weak reference that remembers the items' id for cleanup
+    __slots__ = ("id",)
+
+    def __new__(cls, item, id):
+        return super().__new__(cls, item, _collected)
+
+    def __init__(self, item, id):
+        super().__init__(item, _collected)
+        self.id = id
+
+
+def _collected(ref):
+    _smartitems._collected(ref)
+
+
+class _SmartRegistry(MutableMapping):
+    """{"item string name": SmartObject} mapping. Items that only exist 
+    Python-side are held by weak reference, and are dropped (releasing 
+    their id) once nothing else references them. Realized items are held 
+    strongly until they're deleted."""
+
+    def __init__(self):
+        self.weak = True
+        self._refs = {}  # {"item string name": weakref}
+        self._pinned = {}  # {"item string name": SmartObject}
+
+    def __getitem__(self, id):
+        if (item := self._refs[id]()) is None:
+            raise KeyError(id)
+        return item
+
+    def __setitem__(self, id, item):
+        self._refs[id] = _ItemRef(item, id)
+        if not self.weak:
+            self._pinned[id] = item
+
+    def __delitem__(self, id):
+        del self._refs[id]
+        self._pinned.pop(id, None)
+
+    def __iter__(self):
+        return iter([id for id, _ in self.items()])
+
+    # items can be collected at any point (i.e. a collected reference cycle), 
+    # so the views are lists of the items alive when they're called. <_refs>
+    # is copied first since collection changes it
+    def items(self):
+        return [(id, item) for id, ref in self._refs.copy().items() if (item := ref()) is not None]
+
+    def values(self):
+        return [item for _, item in self.items()]
+
+    # MutableMapping's versions go through <__iter__>, copying <_refs> per item
+    def popitem(self):
+        while self._refs:
+            id, ref = self._refs.popitem()
+            self._pinned.pop(id, None)
+            if (item := ref()) is not None:
+                return id, item
+
+        raise KeyError("popitem(): registry is empty")
+
+    def clear(self):
+        """Unregisters every item, releasing their ids."""
+        ids = [*self._refs]
+        self._refs.clear()
+        self._pinned.clear()
+        for id in ids:
+            _release(id)
+
+    def __len__(self):
+        return len(self._refs)
+
+    def _collected(self, ref):
+        if self._refs.get(ref.id) is ref:
+            del self._refs[ref.id]
+            _release(ref.id)
+
+    def pin(self, item):
+        """Keeps <item> alive until it's removed from the registry."""
+        self._pinned[item.id] = item
+
+    def is_pinned(self, id):
+        return id in self._pinned
+
+    def purge(self, ids):
+        """Removes many items at once. Returns the ones that were registered."""
+        refs, pinned = self._refs, self._pinned
+        items = []
+        for id in ids:
+            pinned.pop(id, None)
+            if (ref := refs.pop(id, None)) is not None and (item := ref()) is not None:
+                items.append(item)
+
+        return items
+
+
+_smartitems = _SmartRegistry()
+_compact_classes = {}  # {SmartObject subclass: compact subclass}
+_reserved_ids = set()  # generated or user-provided item ids in use
+_ids_lock = threading.Lock()  # items can be built from several threads
+
+# write-back mode; while enabled, config updates for existing items
+# are collected here and sent as one <configure_item> call per item
+_writeback = False
+_dirty = {}  # {"item string name": {option: value}}
+_writeback_stats = {"writes": 0, "calls": 0, "flushes": 0, "dropped": 0}
+
+_frame_callbacks = []
+_frames_driven = False  # True once something calls <run_frame> every frame
+_chained_render_callback = None  # render callback set before <_drive_frames>
+
+# <smartwidgets.threads.UpdateQueue> while writes from other 
+# threads are being marshaled to the render thread
+_marshal = None
+
+
+class _BuildState(threading.local):
+    # deferred mode is per-thread so trees can be built off
+    # the render thread
+    def __init__(self):
+        self.deferred = False
+        self.stack = []  # deferred parents
+        self.roots = []  # deferred items without a deferred parent
+
+
+_build = _BuildState()
+
+# Python-side item tree of the items added through smartwidgets (and the 
+# containers they were added to), so reading children/parents doesn't call 
+# into dearpygui. Top-level items are under "".
+_children = {}  # {"parent id": [child ids, in order]}
+_parents = {}  # {"item id": "parent id"}
 
 
 # these cannot be changed via core.configure_item
@@ -25,12 +183,12 @@ _smartconfig = {}
 _SPECIAL_CONFIG = {
     # option: (getter, (setter, {**kwargs}))
     # getters so far only have required 1 argument (item name/id)
-    'callback': (get_item_callback, (set_item_callback, {
+    'callback': (dpg.get_item_callback, (dpg.set_item_callback, {
         "item": "id",
         "callback": "callback",
         "callback_data": "callback_data"
     })),
-    'callback_data': (get_item_callback_data, (set_item_callback_data, {
+    'callback_data': (dpg.get_item_callback_data, (dpg.set_item_callback_data, {
         "item": "id",
         "callback_data": "callback_data"
     })),
@@ -46,6 +204,547 @@ def smartitem(id: str):
     return None
 
 
+def snapshot(*items: Union[str, SmartObject]):
+    """Returns a dictionary of {"item string name": configuration} for 
+    <items> (ids or SmartObjects), fetching each items' dearpygui 
+    configuration only once. Options pending in write-back mode are 
+    included."""
+    snapshots = {}
+    for item in items:
+        id = str(item)
+        config = dpg.get_item_configuration(id)
+        if (pending := _dirty.get(id)):
+            config.update(pending)
+
+        snapshots[id] = config
+
+    return snapshots
+
+
+def on_frame(callback: Callable):
+    """Registers <callback> to be called (without arguments) once 
+    per frame by <run_frame>. Returns <callback>, so this can also 
+    be used as a decorator."""
+    if callback not in _frame_callbacks:
+        _frame_callbacks.append(callback)
+    # registered while dearpygui runs without calling <run_frame>
+    if not _frames_driven and dpg.is_dearpygui_running():
+        _drive_frames()
+
+    return callback
+
+
+def off_frame(callback: Callable):
+    """Unregisters a callback registered with <on_frame>."""
+    if callback in _frame_callbacks:
+        _frame_callbacks.remove(callback)
+
+
+def run_frame():
+    """Calls every callback registered with <on_frame>. If callbacks are 
+    registered, <Window.start> sets a render callback that calls this 
+    every frame. If you set your own render callback, call this from it 
+    (smartwidgets won't replace it once this has been called)."""
+    global _frames_driven
+    _frames_driven = True
+
+    for callback in [*_frame_callbacks]:
+        callback()
+
+
+def _render_callback(sender, data):
+    if _chained_render_callback is not None:
+        _chained_render_callback(sender, data)
+    run_frame()
+
+
+def _drive_frames():
+    # makes dearpygui call <run_frame> every frame. A render callback that 
+    # was already set is kept (and called first) if the backend can report 
+    # it (get_render_callback)
+    global _frames_driven, _chained_render_callback
+    try:
+        previous = dpg.get_render_callback()
+    except AttributeError:
+        previous = None
+    if previous is not _render_callback:
+        _chained_render_callback = previous
+
+    dpg.set_render_callback(_render_callback)
+    _frames_driven = True
+
+
+def set_write_back(enabled: bool = True):
+    """Toggles write-back mode. While enabled, setting a config option
+    on an item that exists in dearpygui only marks it as dirty. Pending 
+    options are sent to dearpygui with one <configure_item> call per item 
+    on <flush>, which runs once per frame. Disabling write-back flushes 
+    any pending options."""
+    global _writeback
+    _writeback = enabled
+
+    if enabled:
+        on_frame(flush)
+    else:
+        off_frame(flush)
+        flush()
+
+
+@contextmanager
+def write_back():
+    """Context manager. Enables write-back mode for the block, and
+    flushes pending options when it exits."""
+    previous = _writeback
+    set_write_back(True)
+    try:
+        yield
+    finally:
+        set_write_back(previous)
+        flush()
+
+
+def flush():
+    """Sends all pending write-back options to dearpygui. Options of items 
+    that no longer exist (i.e. deleted with <dearpygui.core.delete_item>) are
+    dropped. If an update fails for another reason, the remaining ones are 
+    still sent before the error is raised. Returns the number of 
+    <configure_item> calls made."""
+    global _dirty
+    if not _dirty:
+        return 0
+
+    pending, _dirty = _dirty, {}
+    calls, error = 0, None
+    for id, config in pending.items():
+        try:
+            dpg.configure_item(id, **config)
+        except Exception as exc:
+            _writeback_stats["dropped"] += len(config)
+            if error is None and dpg.does_item_exist(id):
+                error = exc
+        else:
+            calls += 1
+
+    _writeback_stats["calls"] += calls
+    _writeback_stats["flushes"] += 1
+    if error is not None:
+        raise error
+
+    return calls
+
+
+def write_back_stats():
+    """Returns a dictionary of write-back counters. <writes> is the number 
+    of deferred option updates, <calls> the number of <configure_item> calls
+    made by <flush>, <pending> the number of items waiting to be flushed, 
+    <dropped> the number of updates that couldn't be sent, and <coalesced> 
+    the number of calls saved."""
+    stats = dict(_writeback_stats)
+    stats["pending"] = len(_dirty)
+    stats["coalesced"] = stats["writes"] - stats["calls"] - stats["pending"] - stats["dropped"]
+
+    return stats
+
+
+def sync_states():
+    """Finds realized items that no longer exist in dearpygui (i.e. deleted
+    with <dearpygui.core.delete_item>), marks them as deleted and unregisters
+    them. Returns a list of their ids. Can be registered with <on_frame>."""
+    stale = [
+        id for id, item in _smartitems.items()
+        if item._state is ItemState.REALIZED and not dpg.does_item_exist(id)
+    ]
+    for id in stale:
+        _smartitems.pop(id)._state = ItemState.DELETED
+        _release(id)
+        _unlink(id)
+        _children.pop(id, None)
+
+    return stale
+
+
+def reserve_ids(cls: type, n: int):
+    """Reserves <n> unique ids for items of <cls>, returning them in a list.
+    Useful when creating many items at once. Ids are tracked Python-side 
+    instead of probing dearpygui, so items created directly through dearpygui 
+    should avoid smartwidgets' naming scheme ("ClassName<n>")."""
+    with _ids_lock:
+        counter = cls.__dict__.get("_generator_id") or 0
+
+        ids = []
+        while len(ids) < n:
+            # only ids passed in by the user can be skipped here
+            if (id := f'{cls.__name__}<{counter}>') not in _reserved_ids:
+                ids.append(id)
+            counter += 1
+
+        cls._generator_id = counter
+        _reserved_ids.update(ids)
+
+    return ids
+
+
+def _reset():
+    # forgets every item and resets the Python-side state (write-back, frame
+    # callbacks, marshaling, this threads' deferred mode) without calling 
+    # into dearpygui. Used between benchmarks and tests, which each run 
+    # against a new backend
+    global _writeback, _frames_driven, _chained_render_callback, _marshal
+    _smartitems.clear()
+    _smartitems.weak = True
+    _reserved_ids.clear()
+    _children.clear()
+    _parents.clear()
+
+    _writeback = False
+    _dirty.clear()
+    _writeback_stats.update(dict.fromkeys(_writeback_stats, 0))
+    _frame_callbacks.clear()
+    _frames_driven = False
+    _chained_render_callback = None
+    _marshal = None
+    _build.__init__()
+
+
+def set_weak_registry(enabled: bool = True):
+    """Toggles weak references in the item registry (enabled by default). 
+    When disabled, every item is kept alive from construction until it's
+    deleted."""
+    _smartitems.weak = enabled
+    if not enabled:
+        for id, item in _smartitems.items():
+            _smartitems.pin(item)
+
+
+def registry_report():
+    """
+    Returns a dictionary describing the item registry:
+        items: Number of registered items.
+        realized: Number of registered items that were added to dearpygui.
+        unrealized: Ids of items that were never added to dearpygui.
+        orphaned: Ids of realized items that no longer exist in dearpygui.
+        classes: {"class name": item count}
+        bytes: Estimated number of bytes retained by the items.
+        class_bytes: {"class name": estimated bytes}
+    """
+    report = {
+        "items": 0,
+        "realized": 0,
+        "unrealized": [],
+        "orphaned": [],
+        "classes": {},
+        "bytes": 0,
+        "class_bytes": {},
+    }
+    for id, item in _smartitems.items():
+        name = item.__class__.__name__
+        size = _estimate_size(item)
+
+        report["items"] += 1
+        report["classes"][name] = report["classes"].get(name, 0) + 1
+        report["class_bytes"][name] = report["class_bytes"].get(name, 0) + size
+        report["bytes"] += size
+
+        if item._state is ItemState.REALIZED:
+            report["realized"] += 1
+            if not dpg.does_item_exist(id):
+                report["orphaned"].append(id)
+        else:
+            report["unrealized"].append(id)
+
+    return report
+
+
+def _estimate_size(item):
+    # the instance, its attribute dict, and the values it holds
+    # (shared values like small ints/None are counted too)
+    size = sys.getsizeof(item)
+    if (attrs := getattr(item, "__dict__", None)) is not None:
+        size += sys.getsizeof(attrs)
+        size += sum(sys.getsizeof(value) for value in attrs.values())
+    if item._compact:
+        size += sum(
+            sys.getsizeof(getattr(item, slot, None)) 
+            for slot in item.__class__.__slots__
+        )
+
+    return size
+
+
+def set_deferred(enabled: bool = True):
+    """Toggles deferred mode for the current thread. While enabled, <add>, 
+    <end> and the context manager only record the parent/child structure 
+    of items Python-side. Nothing is added to dearpygui until <realize>."""
+    _build.deferred = enabled
+
+
+@contextmanager
+def deferred():
+    """Context manager. Enables deferred mode for the block, yielding a 
+    list that is filled with the top-level items recorded in it."""
+    previous, roots = _build.deferred, _build.roots
+    _build.deferred, _build.roots = True, []
+    try:
+        yield _build.roots
+    finally:
+        _build.deferred = previous
+        _build.roots = roots + _build.roots
+
+
+def realize(*items: SmartObject):
+    """Adds deferred items, and the deferred items recorded within them, to 
+    dearpygui in a single pass. Every configuration is computed before the 
+    first item is added. If no items are passed, all top-level items recorded 
+    by the current thread are realized. Returns the realized top-level items."""
+    if items:
+        _build.roots = [root for root in _build.roots if root not in items]
+    else:
+        items, _build.roots = _build.roots, []
+
+    stack = []
+    for item, config in _build_plan(items):
+        if item is None:
+            dpg.end()
+            stack.pop()
+            continue
+
+        item._func(name=item.id, **config)
+        item._state = ItemState.REALIZED
+        _smartitems.pin(item)
+
+        if stack:
+            _link(item.id, stack[-1])
+        elif not isinstance(item, SmartDependant):
+            _link(item.id, "")
+        else:
+            _link(item.id, config.get("parent") or _open_parent(item.id), config.get("before", ""))
+        if item._container:
+            stack.append(item.id)
+
+    return [*items]
+
+
+def _build_plan(items):
+    # [(item, config), ...] in the order they need to be added, where 
+    # (None, None) ends the last parent's stack
+    plan = []
+    pending = [*reversed(items)]
+    while pending:
+        if (item := pending.pop()) is None:
+            plan.append((None, None))
+            continue
+
+        plan.append((item, item.configuration()))
+        if item._container:
+            pending.append(None)
+            pending.extend(reversed(vars(item).pop("_deferred_children", ())))
+
+    return plan
+
+
+def _record(item):
+    # deferred counterpart to <add>
+    if _build.stack:
+        parent = _build.stack[-1]
+        vars(parent).setdefault("_deferred_children", []).append(item)
+    else:
+        _build.roots.append(item)
+
+    if item._container:
+        _build.stack.append(item)
+
+
+def _link(id: str, parent: str, before: str = ""):
+    # adds <id> (already in dearpygui) to the tree index
+    if parent and parent not in _parents:
+        # added to a container smartwidgets doesn't know about
+        _track(parent)
+        _parents[id] = parent
+        return
+
+    siblings = _children.setdefault(parent, [])
+    if before and before in siblings:
+        siblings.insert(siblings.index(before), id)
+    else:
+        siblings.append(id)
+    _parents[id] = parent
+
+
+def _unlink(id: str):
+    # removes <id> from its parents' children in the tree index
+    if (parent := _parents.pop(id, None)) is not None:
+        try:
+            _children[parent].remove(id)
+        except (KeyError, ValueError):
+            pass
+
+
+def _track(id: str):
+    # adds <id>, a container added directly through dearpygui, to the tree 
+    # index. Its children (and its parents', if <id> is new to it) are read 
+    # from dearpygui, since they may have been added directly as well
+    parent = dpg.get_item_parent(id) or ""
+    if parent and parent not in _parents:
+        _track(parent)
+    elif parent:
+        _children[parent] = dpg.get_item_children(parent) or []
+    else:
+        _children.setdefault("", []).append(id)
+
+    _parents[id] = parent
+    _children[id] = dpg.get_item_children(id) or []
+
+
+def _open_parent(id: str):
+    # parent of <id>, which was just added without one. Asked from dearpygui
+    # since containers can also be opened directly through it
+    return dpg.get_item_parent(id) or ""
+
+
+def _child_ids(id: str):
+    # children of <id>, from the tree index if it's tracked
+    if id in _parents:
+        return [*_children.get(id, ())]
+
+    return dpg.get_item_children(id) or []
+
+
+def _stable(positions: list):
+    # indexes of a longest increasing subsequence of <positions> -
+    # the items that don't need to move
+    tails, links = [], [None] * len(positions)
+    for index, pos in enumerate(positions):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if positions[tails[mid]] < pos:
+                lo = mid + 1
+            else:
+                hi = mid
+        links[index] = tails[lo - 1] if lo else None
+        if lo == len(tails):
+            tails.append(index)
+        else:
+            tails[lo] = index
+
+    stable = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        stable.add(index)
+        index = links[index]
+
+    return stable
+
+
+def verify_tree(fix: bool = False):
+    """Compares the Python-side item tree (used by <children>, <parent> and
+    <delete>) against dearpygui. Items added directly through dearpygui are
+    only known to the tree if they're added to it this way. Returns 
+    {"parent id": (python-side children, dearpygui children)} for every
+    parent that differs. If <fix> is True, the tree is updated to match."""
+    drift = {}
+    for parent, children in [*_children.items()]:
+        if parent and not dpg.does_item_exist(parent):
+            actual = []
+        elif parent:
+            actual = dpg.get_item_children(parent) or []
+        else:
+            actual = [child for child in children if dpg.does_item_exist(child)]
+        if actual != children:
+            drift[parent] = ([*children], actual)
+
+    if fix:
+        for parent, (children, actual) in drift.items():
+            for child in children:
+                if _parents.get(child) == parent:
+                    del _parents[child]
+            if parent and not dpg.does_item_exist(parent):
+                _children.pop(parent, None)
+                _parents.pop(parent, None)
+                continue
+
+            _children[parent] = [*actual]
+            for child in actual:
+                if (previous := _parents.get(child)) not in (None, parent):
+                    _children[previous].remove(child)
+                _parents[child] = parent
+
+    return drift
+
+
+def _release(id: str):
+    # pending options can't be sent to an item that no longer exists,
+    # and its id can be used again
+    _dirty.pop(id, None)
+    _reserved_ids.discard(id)
+
+
+def _subtree(roots: list):
+    # ids of <roots> and of every item under them, from one walk, and the
+    # roots that are under other roots. Only containers (and items that 
+    # aren't in the tree index) are asked for their children
+    refs = _smartitems._refs
+    ids, seen, nested = [], set(), set()
+    is_root = set(roots)
+    pending = [*reversed(roots)]
+    while pending:
+        if (id := pending.pop()) in seen:
+            continue
+        seen.add(id)
+        ids.append(id)
+
+        if (ref := refs.get(id)) is not None and (item := ref()) is not None and not item._container:
+            continue
+        if (children := _child_ids(id)):
+            nested.update(is_root.intersection(children))
+            pending.extend(reversed(children))
+
+    return ids, nested
+
+
+def delete_many(items: list):
+    """Deletes <items> (ids or SmartObjects) and everything under them. Each 
+    subtree is collected in one walk and deleted with one <delete_item> call
+    on its root, and every item in it is unregistered at once."""
+    roots = [
+        *dict.fromkeys(
+            str(item) for item in items 
+            if getattr(item, "_state", None) is not ItemState.DELETED
+        )
+    ]
+    ids, nested = _subtree(roots)
+
+    for root in roots:
+        if root not in nested:  # deleted with its parent
+            dpg.delete_item(root)
+            _unlink(root)
+
+    for id in ids:
+        _release(id)
+        _parents.pop(id, None)
+        _children.pop(id, None)
+    for item in _smartitems.purge(ids):
+        item._state = ItemState.DELETED
+
+
+class ItemState(IntEnum):
+    """Python-side lifecycle of an item. Items start as <CONSTRUCTED>, 
+    become <REALIZED> once added to dearpygui, and are <DELETED> after
+    <delete> is called."""
+    CONSTRUCTED = 0
+    REALIZED = 1
+    DELETED = 2
+
+
+def _is_coroutine_function(value):
+    if value is None:
+        return False
+
+    import inspect  # only imported once a callback is set
+
+    return inspect.iscoroutinefunction(value)
+
+
 class ConfigProperty:
     """Descriptor for general smartwidget configs. Retrieves and
     updates properties dearpygui. Used for the *required* arguments."""
@@ -62,16 +761,19 @@ class ConfigProperty:
         if instance.is_valid:  # exists in dpg
             # updates from dearpygui first since it may have
             # been changed externally
-            # for this reason, __dict__ needs to be used
+            # for this reason, <_store> needs to be used
             # instead of __set/getitem__
-            if self.name in _SPECIAL_CONFIG:
+            pending = _dirty.get(instance.id)
+            if pending and self.name in pending:  # not flushed yet
+                value = pending[self.name]
+            elif self.name in _SPECIAL_CONFIG:
                 value = _SPECIAL_CONFIG[self.name][0](instance.id)
             else:
-                value = get_item_configuration(instance.id)[self.name]
+                value = dpg.get_item_configuration(instance.id)[self.name]
 
-            instance.__dict__[self.name] = value
+            self._store(instance, value)
         else:
-            value = instance.__dict__[self.name]
+            value = self._load(instance)
 
         return value
 
@@ -81,22 +783,172 @@ class ConfigProperty:
         if isinstance(value, SmartObject):
             value = value.id
 
-        instance.__dict__[self.name] = value
+        # unrealized items aren't in dearpygui, so they can be built anywhere
+        if (
+            _marshal is not None 
+            and instance.is_valid 
+            and _marshal.defer((instance, self.name), self.__set__, instance, value)
+        ):
+            return
+
+        if self.name == "callback" and _is_coroutine_function(value):
+            from .aio import coroutine_callback
+            value = coroutine_callback(value)
+
+        self._store(instance, value)
 
         # dearpygui config
         if instance.is_valid:  # exists in dpg
             if self.name in _SPECIAL_CONFIG:
                 setter, kwargs = _SPECIAL_CONFIG[self.name][1]
-                for arg, val in kwargs.copy().items():
-                    kwargs[arg] = instance.__dict__[val]
-
-                setter(**kwargs)
+                setter(**{
+                    arg: _stored_value(instance, attr) 
+                    for arg, attr in kwargs.items()
+                })
+            elif _writeback:
+                _dirty.setdefault(instance.id, {})[self.name] = value
+                _writeback_stats["writes"] += 1
             else:
-                configure_item(instance.id, **{self.name: value})
+                dpg.configure_item(instance.id, **{self.name: value})
 
     def __delete__(self, instance):
         del self
-    
+
+    def _load(self, instance):
+        """Returns the Python-side value of the option."""
+        return instance.__dict__[self.name]
+
+    def _store(self, instance, value):
+        """Updates the Python-side value of the option."""
+        instance.__dict__[self.name] = value
+
+
+class _SlotConfigProperty(ConfigProperty):
+    """<ConfigProperty> that keeps its value in a slot instead of the 
+    instance <__dict__>. Used by <compact> classes."""
+
+    def __init__(self, slot):
+        self.slot = slot  # member descriptor
+
+    def _load(self, instance):
+        return self.slot.__get__(instance)
+
+    def _store(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+def _stored_value(instance, attr: str):
+    # Python-side value of <attr>, without updating it from dearpygui
+    if isinstance((desc := getattr(instance.__class__, attr, None)), ConfigProperty):
+        return desc._load(instance)
+
+    return getattr(instance, attr)
+
+
+def _tuple_getter(getter: type, keys: tuple):
+    # <getter> (itemgetter/attrgetter) that always returns a tuple
+    if not keys:
+        return lambda obj: ()
+    if len(keys) == 1:
+        get = getter(keys[0])
+        return lambda obj: (get(obj),)
+
+    return getter(*keys)
+
+
+class _OptionPlan:
+    """
+    The options of a <_SmartObject> subclass, sorted by how they're read.
+    Built once per class, when the class is created.
+
+    Attributes:
+        options: Every option, in order (see <_SmartObject.options>).
+
+        plain: ConfigProperty options, read from the items' dearpygui 
+        configuration.
+
+        special: ConfigProperty options with their own getters and setters
+        (see <_SPECIAL_CONFIG>).
+
+        addl: Other options (from <_addl_config>), read with getattr.
+
+        stored: <plain> and <special> options, in order.
+
+        in_dict: True if every stored option is kept in the items' <__dict__>.
+    """
+
+    __slots__ = (
+        "options", "plain", "special", "addl", "stored", "descriptors", "in_dict", "load"
+    )
+
+    def __init__(self, cls: type):
+        # <compact> classes redeclare their parents' options
+        chain = [*cls.mro()][:-2]  # exclude <object> and <_SmartObject>
+        options = [
+            attr for kls in chain for attr, val in kls.__dict__.items() 
+            if isinstance(val, ConfigProperty)
+        ]
+        options += cls._addl_config
+        self.options = tuple(dict.fromkeys(options))
+
+        plain, special, addl = [], [], []
+        for opt in self.options:
+            if not isinstance(getattr(cls, opt, None), ConfigProperty):
+                addl.append(opt)
+            elif opt in _SPECIAL_CONFIG:
+                special.append(opt)
+            else:
+                plain.append(opt)
+        self.plain, self.special, self.addl = tuple(plain), tuple(special), tuple(addl)
+        self.stored = tuple(opt for opt in self.options if opt not in self.addl)
+        self.descriptors = {opt: getattr(cls, opt) for opt in self.stored}
+
+        # Python-side values of <stored>, in one call where possible
+        kinds = {type(desc) for desc in self.descriptors.values()}
+        self.in_dict = kinds <= {ConfigProperty}
+        if self.in_dict:
+            get = _tuple_getter(itemgetter, self.stored)
+            self.load = lambda item: get(item.__dict__)
+        elif kinds == {_SlotConfigProperty}:
+            slots = tuple(desc.slot.__name__ for desc in self.descriptors.values())
+            self.load = _tuple_getter(attrgetter, slots)
+        else:
+            descriptors = [*self.descriptors.values()]
+            self.load = lambda item: tuple(desc._load(item) for desc in descriptors)
+
+
+def compact(cls: type):
+    """Returns a subclass of <cls> that stores its <ConfigProperty> options 
+    in slots instead of the instance <__dict__>. Compact instances take up 
+    less memory (see <smartwidgets.bench.memory>), and are otherwise used 
+    exactly like instances of <cls>. The subclass is created once per class.
+
+    Compact instances still have a <__dict__> (holding <id>, <_parent>, etc.),
+    since <cls> and its bases don't define <__slots__>. Moving those attributes
+    to slots as well doesn't save anything, as the dictionary is allocated for
+    instances of <cls> subclasses either way."""
+    if cls in _compact_classes or getattr(cls, "_compact", False):
+        return _compact_classes.get(cls, cls)
+
+    slots = {opt: f"_config_{opt}" for opt in cls._plan.stored}
+
+    compact_cls = type(cls.__name__, (cls,), {
+        "__slots__": tuple(slots.values()),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "_compact": True,
+    })
+    for opt, slot in slots.items():
+        prop = _SlotConfigProperty(compact_cls.__dict__[slot])
+        prop.__set_name__(compact_cls, opt)
+        setattr(compact_cls, opt, prop)
+    compact_cls._plan = _OptionPlan(compact_cls)
+
+    _compact_classes[cls] = compact_cls
+
+    return compact_cls
+
 
 class _SmartObject:
     """
@@ -107,6 +959,9 @@ class _SmartObject:
         core.add_window, core.add_button, etc. High-level subclasses 
         that create items need to overload this.
 
+        _container: True if the item can hold children (its <add> 
+        starts a parent stack that <end> closes).
+
         _generator_id: Used as reference for generating item id's 
         if one isn't provided.
 
@@ -128,12 +983,21 @@ class _SmartObject:
     """
 
     _func: Callable = None  
+    _container: bool = False
     _generator_id: int = None
 
-    _addl_config: list[str] = []  # internally expects an iterable so not None  # internally expects an iterable so not None
+    _addl_config: list[str] = []  # internally expects an iterable so not None
+
+    _state: ItemState = ItemState.CONSTRUCTED
+    _compact: bool = False
 
     def __init__(self, id: Union[str, None] = None, label: Union[str, None] = None):
-        self.id = self._make_id() if id is None else id
+        if id is None:
+            id = self._make_id()
+        else:
+            _reserved_ids.add(id)
+
+        self.id = id
         self.label = self.id if not label else label
 
         _smartitems[self.id] = self
@@ -148,7 +1012,7 @@ class _SmartObject:
         return self.add()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end()
+        self.end()
 
     def __str__(self):
         return f"{self.id}"
@@ -163,15 +1027,11 @@ class _SmartObject:
     @classmethod
     def _make_id(cls):
         """Generates an item's id if one was not provided on initialization."""
-        if cls._generator_id is None:
-            cls._generator_id = 0
-
-        while does_item_exist(id := f'{cls.__name__}<{cls._generator_id}>'):
-            cls._generator_id += 1
+        return reserve_ids(cls, 1)[0]
 
-        cls._generator_id += 1
-
-        return id
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._plan = _OptionPlan(cls)
 
     @classmethod
     def options(cls):
@@ -179,32 +1039,40 @@ class _SmartObject:
         Returns a tuple of the options used by dearpygui for item setup. 
         Most of them can be changed after the item has been added.
         """
-
-        # constructs a list of options used
-        # from the classes it inherits
-        if cls not in _smartconfig:
-            chain = [*cls.mro()][:-2]  # exclude <object> and <_SmartObject>
-            config_optns = [
-                attr for cls in chain for attr, val in cls.__dict__.items() 
-                if isinstance(val, ConfigProperty)
-                ]
-            config_optns += cls._addl_config
-
-            _smartconfig[cls] = tuple(config_optns)
-
-        return _smartconfig[cls]
+        return cls._plan.options
 
     @property
     def is_valid(self):
         """Checks if the item exists in dearpygui."""
         # used by ConfigProperty to properly update
         # values in dearpygui if necessary
-        return does_item_exist(self.id)
+        # tracked Python-side - see <sync_states> for items 
+        # deleted outside of smartwidgets
+        return self._state is ItemState.REALIZED
+
+    @property
+    def state(self):
+        """The items' <ItemState>."""
+        return self._state
 
     def add(self):
         """Adds the item to dearpygui. Behaves exactly like dearpygui.core.add_*.
-         Needs to be followed by <self.end> if this is called directly."""
-        self._func(name=self.id, **self.configuration())
+         Needs to be followed by <self.end> if this is called directly. In 
+         deferred mode, the item is only recorded until <realize> is called."""
+        if _build.deferred:
+            _record(self)
+            return self
+
+        config = self.configuration()
+        self._func(name=self.id, **config)
+        self._state = ItemState.REALIZED
+        _smartitems.pin(self)
+
+        if not isinstance(self, SmartDependant):
+            _link(self.id, "")
+        else:
+            _link(self.id, config.get("parent") or _open_parent(self.id), config.get("before", ""))
+
         return self
 
     @staticmethod
@@ -212,14 +1080,157 @@ class _SmartObject:
         """Ends the items' stack. Behaves exactly like <dearpygui.core.end>.
          If the item is a parent item (an item that can hold children), this 
         must be used after <self.add> before adding a new parent stack."""
-        return end()
+        if _build.deferred:
+            return _build.stack.pop()
+        return dpg.end()
+
+    def _template(self):
+        """Precomputes what <_copy_as> needs from <self>, so many copies 
+        can be made cheaply."""
+        cls = self.__class__
+        attrs = {attr: value for attr, value in vars(self).items() if attr != "_deferred_children"}
+        # don't share mutable state (i.e. ManagedColumns widths)
+        mutable = [attr for attr, value in attrs.items() if isinstance(value, (list, dict, set))]
+        slots = [
+            (slot, getattr(self, slot)) for slot in cls.__slots__ if hasattr(self, slot)
+        ] if self._compact else []
+
+        # labels default to the items' id
+        relabel = None
+        if isinstance((desc := getattr(cls, "label", None)), ConfigProperty):
+            if desc._load(self) == self.id:
+                relabel = desc
+        elif attrs.get("label") == self.id:
+            relabel = "label"
+
+        return attrs, mutable, slots, relabel
+
+    def _copy_as(self, id: str, parent: str = "", template: tuple = None):
+        """Returns a new item of the same class and Python-side configuration 
+        as <self>, registered as realized under <id>. Used for items added to 
+        dearpygui from a precomputed configuration, skipping <__init__>. 
+        <template> is the result of <_template>."""
+        attrs, mutable, slots, relabel = template or self._template()
+
+        cls = self.__class__
+        item = cls.__new__(cls)
+
+        state = vars(item)
+        state.update(attrs)
+        for attr in mutable:
+            state[attr] = state[attr].copy()
+        for slot, value in slots:
+            setattr(item, slot, value)
+
+        if isinstance(relabel, str):
+            state[relabel] = id
+        elif relabel is not None:
+            relabel._store(item, id)
+
+        if "_parent" in state:
+            state["_parent"] = parent
+            state["_before"] = ""
+
+        state["id"] = id
+        state["_state"] = ItemState.REALIZED
+        _reserved_ids.add(id)
+        _smartitems[id] = item
+        _smartitems.pin(item)
+
+        return item
+
+    def clone(self, n: int = 1, parent: Union[str, SmartObject] = None):
+        """Adds <n> copies of the item, and of the smart items within it, to 
+        dearpygui. Works on realized and deferred items. Configurations are 
+        computed once and ids are reserved in bulk, so no constructors or 
+        descriptors run per copy. Copies are added to <parent> (defaults to 
+        the items' parent). Returns a list of the copies."""
+        from .layout import BuildPlan
+
+        if parent is None and "parent" in self.options():
+            parent = self.parent
+
+        steps = []
+        pending = [self]
+        while pending:
+            if (item := pending.pop()) is None:
+                steps.append((None, None))
+                continue
+
+            options = [opt for opt in item.options() if opt not in ("parent", "before")]
+            config = item.configuration(*options)
+            if config.get("label") == item.id:
+                del config["label"]  # defaults to the copies' id
+            if len(options) < len(item.options()):
+                config["parent"] = config["before"] = ""
+
+            steps.append((item, config))
+            if item._container:
+                if item._state is ItemState.REALIZED:
+                    children = [smartitem(child) for child in item.children() or ()]
+                else:
+                    children = vars(item).get("_deferred_children", ())
+
+                pending.append(None)
+                pending.extend(reversed([child for child in children if child is not None]))
+
+        return BuildPlan(steps).realize(parent, copies=n)
+
+    def realize(self):
+        """Adds the deferred item, and the deferred items within it, to 
+        dearpygui. See <smartwidgets.realize>."""
+        realize(self)
+        return self
 
-    def configuration(self):
+    def configuration(self, *options: str):
         """Returns a dictionary of the items' configuration 
-        options and their current values."""
-        return {
-            prop: getattr(self, prop) for prop in self.options()
-        }
+        options and their current values. If <options> are passed,
+        only those are included. If the item exists in dearpygui, 
+        its configuration is fetched once and shared by all options."""
+        plan = self._plan
+        if options:
+            return self._configuration(options)
+
+        if not self.is_valid:
+            values = dict(zip(plan.stored, plan.load(self)))
+            for opt in plan.addl:
+                values[opt] = getattr(self, opt)
+            return values
+
+        config = snapshot(self)[self.id]
+        fetched = {opt: config[opt] for opt in plan.plain if opt in config}
+        if plan.in_dict:
+            self.__dict__.update(fetched)
+        else:
+            for opt, value in fetched.items():
+                plan.descriptors[opt]._store(self, value)
+
+        values = {}
+        for opt in plan.options:
+            values[opt] = fetched[opt] if opt in fetched else getattr(self, opt)
+
+        return values
+
+    def _configuration(self, options: tuple):
+        # <configuration> for some of the options
+        if not self.is_valid:
+            return {prop: getattr(self, prop) for prop in options}
+
+        config = snapshot(self)[self.id]
+        plain = self._plan.plain
+
+        values = {}
+        for prop in options:
+            if prop in config and prop in plain:
+                values[prop] = config[prop]
+                self._plan.descriptors[prop]._store(self, config[prop])
+            else:
+                values[prop] = getattr(self, prop)
+
+        return values
+
+
+_SmartObject._plan = _OptionPlan(_SmartObject)
 
 
 class SmartObject(_SmartObject):
@@ -240,51 +1251,69 @@ class SmartObject(_SmartObject):
         super().__init__(id, label)
 
     def children(self):
-        """Returns a list of the items children."""
-        return get_item_children(self.id)
+        """Returns a list of the items children. Read from the Python-side 
+        item tree (see <verify_tree>) once the item is added."""
+        return _child_ids(self.id)
 
     def is_activated(self):
         """Checks the items' status."""
-        return is_item_activated(self.id)
+        return dpg.is_item_activated(self.id)
 
     def is_container(self):
         """Checks if the item is a container."""
-        return is_item_container(self.id)
+        return dpg.is_item_container(self.id)
 
     def is_focused(self):
         """Checks if the item is currently focused."""
-        return is_item_focused(self.id)
+        return dpg.is_item_focused(self.id)
 
     def is_hovered(self):
         """Checks if the item is currently hovered."""
-        return is_item_hovered(self.id)
+        return dpg.is_item_hovered(self.id)
 
     def is_visible(self):
         """Checks if the item is currently visible on screen."""
-        return is_item_visible(self.id)
+        return dpg.is_item_visible(self.id)
     
     def was_clicked(self):
         # needs docstring
         # is/was clicked?
         # vague function name from dpg
         # need to confirm functionality
-        return is_item_clicked(self.id)
+        return dpg.is_item_clicked(self.id)
 
     def was_edited(self):
         # needs docstring
         # is/was edited?
         # vague function name from dpg
         # need to confirm functionality
-        return is_item_edited(self.id)
+        return dpg.is_item_edited(self.id)
+
+    def reorder(self, children: list):
+        """Rearranges the items' children (ids or SmartDependants) into the 
+        order of <children>, which must hold every child. The longest run 
+        of children already in order stays in place and only the others are 
+        moved, so a small change to a long list only takes a few calls."""
+        order = [str(child) for child in children]
+        current = self.children()
+        if sorted(order) != sorted(current):
+            raise ValueError(f"{order!r} are not the children of '{self.id}'.")
+
+        position = {child: index for index, child in enumerate(current)}
+        stable = _stable([position[child] for child in order])
+
+        following = ""
+        for index in reversed(range(len(order))):
+            if index not in stable:
+                dpg.move_item(order[index], parent=self.id, before=following)
+            following = order[index]
+
+        if self.id in _parents:
+            _children[self.id] = order
 
     def delete(self):  # better alternative to overloading __del__
-        """Unregisters the item in dearpygui and destroys the item."""
-        delete_item(self.id)
-
-        try:
-            _smartitems.pop(self.id)
-        finally:
-            del self
+        """Unregisters the item in dearpygui and destroys the item, and its children."""
+        delete_many([self])
 
 
 class SmartDependant(SmartObject):
@@ -327,7 +1356,9 @@ class SmartDependant(SmartObject):
         if self.is_valid:
             # should have a parent once item is added to dpg
             # otherwise it can't exist
-            self._parent = get_item_parent(self.id)
+            if (parent := _parents.get(self.id)) is None:
+                parent = dpg.get_item_parent(self.id)
+            self._parent = parent
 
         return str(self._parent)
 
@@ -341,9 +1372,11 @@ class SmartDependant(SmartObject):
 
     @property
     def before(self):
-        if self.is_valid:
-            # may not be accurate
-            pass
+        if self.is_valid and (parent := _parents.get(self.id)) is not None:
+            # the next sibling, from the tree index
+            siblings = _children[parent]
+            index = siblings.index(self.id) + 1
+            self._before = siblings[index] if index < len(siblings) else ""
 
         return self._before
 
@@ -355,36 +1388,33 @@ class SmartDependant(SmartObject):
 
         self._before = str(value)
     
-    def delete(self):  # overloaded - needs to remove children from SMARTITEMS
-        """Unregisters the item in dearpygui and destroys the item, and its children."""
-        childs = self.children()
-
-        if childs:
-            for child in childs:
-                if (sitem := smartitem(child)):
-                    sitem.delete()
-
-        try:
-            _smartitems.pop(self.id)
-        finally:
-            delete_item(self.id)
-
-        try:
-            del self
-        finally:
-            pass
-
     def move(self, parent: str | SmartObject, before: str | SmartDependant = None):
         """Changes the items parent, moving it to the end of the new parents' stack."""
-        move_item(self.id, parent= str(parent), before = str(before) or "")
+        parent, before = str(parent), str(before or "")
+        dpg.move_item(self.id, parent=parent, before=before)
+        if self.id in _parents:
+            parent = parent or _parents[self.id]
+            _unlink(self.id)
+            _link(self.id, parent, before)
 
     def move_up(self):
         """Moves the item up 1 in the parents' stack."""
-        move_item_up(self.id)
+        dpg.move_item_up(self.id)
+        self._shift(-1)
 
     def move_down(self):
         """Moves the item down 1 in the parents' stack."""
-        move_item_down(self.id)
+        dpg.move_item_down(self.id)
+        self._shift(1)
+
+    def _shift(self, offset: int):
+        # <move_up>/<move_down> in the tree index
+        if (parent := _parents.get(self.id)) is None:
+            return
+        siblings = _children[parent]
+        index = siblings.index(self.id)
+        if 0 <= index + offset < len(siblings):
+            siblings[index], siblings[index + offset] = siblings[index + offset], siblings[index]
 
 
 class AddOnlyMixin:
@@ -0,0 +1,448 @@
+"""
+Benchmarks for smartwidgets' Python-side overhead.
+
+Benchmarks run against <HeadlessBackend> by default, so they don't need a
+GPU context. Every result reports its wall time and the number of backend
+(dearpygui) calls made. Run with:
+
+    python -m smartwidgets.bench [-n 1000] [-o results.json]
+"""
+import gc
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+import platform
+import tracemalloc
+from typing import Callable
+
+from .backend import Backend, HeadlessBackend, get_backend, set_backend
+from .bases import compact, _reset
+
+
+__all__ = [
+    "CountingBackend",
+    "run",
+    "save",
+    "memory",
+    "bench_construction",
+    "bench_property_access",
+    "bench_configuration",
+    "bench_delete",
+    "bench_managed_columns",
+    "bench_reorder",
+    "bench_startup",
+]
+
+
+class CountingBackend(Backend):
+    """Wraps another backend, counting the calls made to it."""
+
+    def __init__(self, backend: Backend):
+        self.backend = backend
+        self.name = backend.name
+        self.calls = 0
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        func = getattr(self.backend, name)
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return func(*args, **kwargs)
+
+        setattr(self, name, counted)
+
+        return counted
+
+
+def _measure(name: str, n: int, func: Callable, **params):
+    # runs <func> once, returning its wall time and backend call count
+    backend = get_backend()
+    calls = backend.calls
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        wall_time = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    return {
+        "name": name,
+        **params,
+        "n": n,
+        "wall_time": wall_time,
+        "per_op_us": wall_time / n * 1e6,
+        "calls": (calls := backend.calls - calls),
+        "calls_per_op": calls / n,
+    }
+
+
+def _host():
+    # a realized window for the benchmarked items
+    from .containers import Window
+
+    window = Window().add()
+    window.end()
+
+    return window
+
+
+def bench_construction(n: int = 1000):
+    """Constructs and adds <n> Windows, Groups, Buttons and InputFloat4s."""
+    from .containers import Window, Group
+    from .buttons import Button
+    from .inputs import InputFloat4
+
+    results = []
+    for cls in (Window, Group, Button, InputFloat4):
+        parent = None if cls is Window else _host()
+
+        def build():
+            for _ in range(n):
+                item = cls(parent=parent) if parent else cls()
+                item.add()
+                if item._container:
+                    item.end()
+
+        results.append(_measure("construction", n, build, cls=cls.__name__))
+
+    return results
+
+
+def bench_property_access(n: int = 1000):
+    """Reads and writes a <ConfigProperty> of a realized Button <n> times."""
+    from .buttons import Button
+
+    button = Button(parent=_host()).add()
+
+    def get():
+        for _ in range(n):
+            button.width
+
+    def set():
+        for i in range(n):
+            button.width = i
+
+    return [
+        _measure("property_get", n, get, cls="Button", option="width"),
+        _measure("property_set", n, set, cls="Button", option="width"),
+    ]
+
+
+def bench_configuration(n: int = 1000):
+    """Calls <configuration> <n> times on a realized item of each class."""
+    from . import containers, buttons, widgets
+    from .inputs import input, drag, slider
+
+    items = []
+    # some items only take their parent from the container stack
+    with containers.Window() as window:
+        items.append(window)
+        for cls in (
+            containers.Child,
+            containers.Group,
+            containers.MenuBar,
+            containers.Menu,
+            containers.TabBar,
+            containers.TreeNode,
+            containers.ManagedColumns,
+            buttons.Button,
+            widgets.Text,
+            *(getattr(module, name) for module in (input, drag, slider) for name in module.__all__),
+        ):
+            item = cls().add()
+            if item._container:
+                item.end()
+            items.append(item)
+
+    results = []
+    for item in items:
+        def configure():
+            for _ in range(n):
+                item.configuration()
+
+        results.append(_measure(
+            "configuration", n, configure, cls=item.__class__.__name__, 
+            options=len(item.options())
+        ))
+
+    return results
+
+
+def bench_delete(n: int = 1000):
+    """Deletes a deep tree (a chain of <n> nested Groups) and a wide 
+    tree (a Group holding <n> Buttons)."""
+    from .containers import Group
+    from .buttons import Button
+
+    results = []
+
+    # deep
+    depth = n
+    root = Group(parent=_host()).add()
+    for _ in range(depth - 1):
+        Group().add()
+    for _ in range(depth):
+        root.end()
+
+    results.append(_measure("delete", depth, root.delete, shape="deep"))
+
+    # wide
+    root = Group(parent=_host()).add()
+    for _ in range(n):
+        Button().add()
+    root.end()
+
+    results.append(_measure("delete", n, root.delete, shape="wide"))
+
+    return results
+
+
+def bench_managed_columns(n: int = 1000):
+    """Sets and reads back the width of a realized 4-column ManagedColumns 
+    <n> times."""
+    from .containers import ManagedColumns
+
+    columns = ManagedColumns(columns=4, parent=_host()).add()
+    columns.end()
+
+    def round_trip():
+        for i in range(n):
+            columns.width = i
+            columns.width
+
+    return [_measure("managed_columns_width", n, round_trip, columns=4)]
+
+
+def bench_reorder(n: int = 1000):
+    """Reorders a Group of <n> Buttons: moving one Button to the front,
+    reversing them, and shuffling them."""
+    import random
+    from .containers import Group
+    from .buttons import Button
+
+    root = Group(parent=_host()).add()
+    for _ in range(n):
+        Button().add()
+    root.end()
+
+    rng = random.Random(0)
+    results = []
+    for shape in ("one_moved", "reversed", "shuffled"):
+        order = root.children()
+        if shape == "one_moved":
+            order.insert(0, order.pop())
+        elif shape == "reversed":
+            order.reverse()
+        else:
+            rng.shuffle(order)
+
+        results.append(_measure("reorder", n, lambda: root.reorder(order), shape=shape))
+
+    return results
+
+
+def bench_array_sync(n: int = 1000):
+    """Syncs <n> DragFloat3s with an <ArrayBinding>: setting every value 
+    one by one, pushing after 1% of the rows changed, and pulling every 
+    value. Skipped if NumPy isn't installed."""
+    try:
+        import numpy
+    except ImportError:
+        return []
+    from .backend import core as dpg
+    from .containers import Group
+    from .inputs import DragFloat3
+    from .arrays import ArrayBinding
+
+    root = Group(parent=_host()).add()
+    items = [DragFloat3().add() for _ in range(n)]
+    root.end()
+
+    binding = ArrayBinding(items, numpy.random.default_rng(0).random((n, 3)))
+    binding.push()
+
+    def per_item():
+        for item, row in zip(items, binding.array.tolist()):
+            dpg.set_value(item.id, row)
+
+    binding.array[:max(n // 100, 1)] += 1
+
+    return [
+        _measure("array_sync", n, per_item, shape="per_item"),
+        _measure("array_sync", n, binding.push, shape="push_changed"),
+        _measure("array_sync", n, binding.pull, shape="pull"),
+    ]
+
+
+# (shape, statements timed in a new interpreter)
+STARTUP = [
+    ("import", "import smartwidgets"),
+    ("one_item", "from smartwidgets import Button"),
+    ("all_items", "from smartwidgets import *"),
+]
+
+
+def bench_startup(n: int = 1000):
+    """Times importing smartwidgets in a new interpreter (the median of up to 
+    20 runs, as <n> runs would take too long). Uses the headless backend, so 
+    dearpygui isn't imported."""
+    runs = min(n, 20)
+    env = {**os.environ, "SMARTWIDGETS_BACKEND": "headless"}
+
+    results = []
+    for shape, statement in STARTUP:
+        code = (
+            "import time; start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(time.perf_counter() - start)"
+        )
+        times = [
+            float(subprocess.run(
+                [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+            ).stdout)
+            for _ in range(runs)
+        ]
+        wall_time = statistics.median(times)
+        results.append({
+            "name": "startup",
+            "shape": shape,
+            "n": runs,
+            "wall_time": wall_time,
+            "per_op_us": wall_time * 1e6,
+            "calls": 0,
+            "calls_per_op": 0.0,
+        })
+
+    return results
+
+
+BENCHMARKS = {
+    "construction": bench_construction,
+    "property_access": bench_property_access,
+    "configuration": bench_configuration,
+    "delete": bench_delete,
+    "managed_columns": bench_managed_columns,
+    "reorder": bench_reorder,
+    "array_sync": bench_array_sync,
+    "startup": bench_startup,
+}
+
+
+def run(n: int = 1000, *, only: list[str] = None, backend: Callable[[], Backend] = HeadlessBackend):
+    """Runs the benchmarks named in <only> (all of <BENCHMARKS> by default), 
+    each against a fresh backend created by calling <backend>. Returns a 
+    JSON-serializable dictionary of the results."""
+    results = []
+    for name in only or BENCHMARKS:
+        previous = set_backend(CountingBackend(backend()))
+        try:
+            results.extend(BENCHMARKS[name](n))
+        finally:
+            _reset()
+            set_backend(previous)
+
+    return {
+        "timestamp": time.time(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "n": n,
+        "results": results,
+    }
+
+
+def save(results: dict, path: str):
+    """Writes the results of <run> to <path> as JSON."""
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def memory(cls: type, n: int = 10_000, factory: Callable = None):
+    """Measures the memory used by <n> unrealized instances of <cls>, 
+    and by <n> instances of its <compact> counterpart. <factory> is called 
+    with the class to create each instance (defaults to calling the class 
+    without arguments). Returns a dictionary of the average bytes per 
+    instance for each layout."""
+    factory = factory or (lambda c: c())
+
+    results = {}
+    for layout, kls in (("dict", cls), ("compact", compact(cls))):
+        build = lambda: [factory(kls) for _ in range(n)]
+        # the first run grows the registry and id tables, so
+        # only per-instance memory is measured by the second
+        _traced_bytes(build)
+        results[layout] = _traced_bytes(build) / n
+
+    results["saved"] = 1 - results["compact"] / results["dict"]
+
+    return results
+
+
+def _traced_bytes(func: Callable):
+    # bytes allocated by <func> that are still alive when it returns
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        retained = func()
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    del retained
+    gc.collect()
+
+    return used
+
+
+def _main():
+    import argparse
+
+    from .containers import Window, Group
+    from .buttons import Button
+    from .inputs import InputFloat4, InputText
+
+    parser = argparse.ArgumentParser(prog="python -m smartwidgets.bench")
+    parser.add_argument("-n", type=int, default=1000, help="operations per benchmark")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--only", nargs="+", choices=[*BENCHMARKS], help="benchmarks to run")
+    parser.add_argument("--memory", action="store_true", help="also compare compact layouts")
+    args = parser.parse_args()
+
+    results = run(args.n, only=args.only)
+    if args.memory:
+        results["memory"] = {
+            cls.__name__: memory(cls) 
+            for cls in (Window, Group, Button, InputFloat4, InputText)
+        }
+
+    for result in results["results"]:
+        label = " ".join(
+            str(value) for key, value in result.items() 
+            if key not in ("n", "wall_time", "per_op_us", "calls", "calls_per_op")
+        )
+        print(
+            f"{label:<40} {result['per_op_us']:>10.2f} us/op "
+            f"{result['calls_per_op']:>8.2f} calls/op"
+        )
+    for name, result in results.get("memory", {}).items():
+        print(
+            f"memory {name:<33} dict: {result['dict']:>8.1f} B  "
+            f"compact: {result['compact']:>8.1f} B  "
+            f"saved: {result['saved']:>6.1%}"
+        )
+
+    if args.output:
+        save(results, args.output)
+
+
+if __name__ == "__main__":
+    _main()
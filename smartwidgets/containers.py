@@ -1,13 +1,26 @@
 from typing import Any, Callable, Union
 
-from dearpygui import core as dpg
-
-from .bases import ConfigProperty, SmartObject, SmartDependant
+from . import bases
+from .backend import core as dpg
+
+from .bases import (
+    ConfigProperty, 
+    SmartObject, 
+    SmartDependant, 
+    ItemState,
+    flush, 
+    on_frame, 
+    off_frame, 
+    _drive_frames,
+    _link,
+)
+from .widgets import Text
 
 
 __all__ = [
     "Window",
     "Child",
+    "VirtualList",
     "Group",
     "MenuBar",
     "Menu",
@@ -86,6 +99,7 @@ class Window(SmartObject):
     """
 
     _func = dpg.add_window
+    _container = True
     _addl_config = ["on_close"]
 
     width = ConfigProperty()
@@ -164,10 +178,30 @@ class Window(SmartObject):
     def on_close(self):
         return self._on_close
 
-    def start(self):
-        """Starts dearpygui with <self> as the primary window."""
+    def start(self, *, run_frames: bool = True):
+        """Starts dearpygui with <self> as the primary window. Callbacks
+        registered with <on_frame> are run once per frame by a render 
+        callback, which is only set if callbacks are registered. A render 
+        callback set beforehand is called first if dearpygui can report it, 
+        and replaced otherwise. Pass <run_frames=False> to keep your own 
+        render callback as is; it then needs to call <run_frame>."""
+        flush()
+        if not run_frames:
+            bases._frames_driven = True
+        elif bases._frame_callbacks and not bases._frames_driven:
+            _drive_frames()
         dpg.start_dearpygui(primary_window=self.id)
 
+    async def start_async(self, *, frame_budget: float = 0.002):
+        """Coroutine. Starts dearpygui with <self> as the primary window, 
+        rendering frames from the running asyncio event loop and yielding 
+        to it for up to <frame_budget> seconds between frames. See 
+        <smartwidgets.aio.run>."""
+        from .aio import run  # asyncio is only imported when needed
+
+        flush()
+        await run(self, frame_budget=frame_budget)
+
     def stop(self):
         """Stops the application."""
         dpg.stop_dearpygui()
@@ -221,6 +255,7 @@ class Child(SmartDependant):
     """
 
     _func = dpg.add_child
+    _container = True
 
     show = ConfigProperty()
     tip = ConfigProperty()
@@ -286,6 +321,146 @@ class Child(SmartDependant):
         self.autosize_y = True
 
 
+class VirtualList(Child):
+    """
+    A Child item that lists <count> rows but only keeps enough row items to
+    fill its <height>. Once per frame (see <on_frame>), the rows are rebound to
+    the entries that are scrolled into view. Dummy items above and below the 
+    rows take up the space of the rest, so the scrollbar behaves as if every
+    row existed. Build and update costs depend on the height of the item, not 
+    on <count>.
+
+    Parameters:
+        render: Called as <render(row, index)> to show entry <index> in <row>,
+        (i.e. <lambda row, i: dpg.set_value(row.id, names[i])>).
+
+        *Optional Keyword-only Parameters
+
+        count: The number of rows.
+
+        row: Called without arguments to make a (not yet added) row item. Defaults
+        to an empty <Text>.
+
+        row_height: The height of a row (in pixels), including item spacing.
+
+        overscan: The number of extra rows kept past the bottom of the item.
+
+        All other parameters are the same as for <Child>.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[SmartDependant, int], Any],
+        id: str = None,
+        *,
+        count: int = 0,
+        row: Callable[[], SmartDependant] = None,
+        row_height: int = 21,
+        overscan: int = 1,
+        height: int = 200,
+        **kwargs,
+        ):
+        super().__init__(id, height=height, **kwargs)
+        self.render = render
+        self.row = row or (lambda: Text(""))
+        self.row_height = row_height
+        self.overscan = overscan
+        self._count = count
+        self._rows = []
+        self._shown = 0  # rows in use
+        self._first = None  # index of the entry shown in the first row
+        self._spacers = None
+
+    @property
+    def count(self):
+        return self._count
+
+    @count.setter
+    def count(self, value: int):
+        self._count = value
+        self.refresh()
+
+    @property
+    def rows(self):
+        """The live row items."""
+        return [*self._rows]
+
+    @property
+    def first(self):
+        """The index of the entry shown in the first row."""
+        return self._first or 0
+
+    def add(self):
+        """Adds the item to dearpygui, and starts updating its rows every frame.
+        Needs to be followed by <self.end> if this is called directly."""
+        super().add()
+        on_frame(self.update)
+        return self
+
+    def delete(self):
+        off_frame(self.update)
+        self._rows = []
+        super().delete()
+
+    def refresh(self):
+        """Rebinds every row on the next update. Use after the data changes."""
+        self._first = None
+
+    def scroll_to(self, index: int):
+        """Scrolls the item so entry <index> is the first row."""
+        dpg.set_y_scroll(self.id, index * self.row_height)
+        self.update()
+
+    def _build(self):
+        top, bottom = f"{self.id}::top", f"{self.id}::bottom"
+        dpg.add_dummy(name=top, parent=self.id, height=0)
+        dpg.add_dummy(name=bottom, parent=self.id, height=0)
+        _link(top, self.id)
+        _link(bottom, self.id)
+        self._spacers = top, bottom
+
+    def _fill(self, n: int):
+        # adds rows until there are <n>
+        while len(self._rows) < n:
+            row = self.row()
+            row.parent = self.id
+            row.before = self._spacers[1]
+            self._rows.append(row.add())
+
+    def update(self):
+        """Rebinds the rows to the entries in view. Called every frame once the
+        item is added."""
+        if self._state is ItemState.DELETED:  # i.e. with its parent
+            off_frame(self.update)
+        if not self.is_valid:
+            return
+        if self._spacers is None:
+            self._build()
+
+        row_height = self.row_height
+        shown = min(self.height // row_height + 1 + self.overscan, self._count)
+        first = min(int(dpg.get_y_scroll(self.id) // row_height), self._count - shown)
+        if first == self._first and shown <= len(self._rows):
+            return
+
+        self._fill(shown)
+        rows = self._rows
+        for row in rows[shown:self._shown]:
+            row.show = False
+        for row in rows[self._shown:shown]:
+            row.show = True
+
+        render = self.render
+        for offset in range(shown):
+            render(rows[offset], first + offset)
+
+        top, bottom = self._spacers
+        dpg.configure_item(top, height=first * row_height)
+        dpg.configure_item(bottom, height=(self._count - first - shown) * row_height)
+        self._first = first
+        self._shown = shown
+
+
 class Group(SmartDependant):
     """
     Base class for Group items. Groups are containers (like Child items) with limited
@@ -323,6 +498,7 @@ class Group(SmartDependant):
     """
 
     _func = dpg.add_group
+    _container = True
 
     show = ConfigProperty()
     tip = ConfigProperty()
@@ -354,6 +530,7 @@ class Group(SmartDependant):
 
 class MenuBar(SmartDependant):
     _func = dpg.add_menu_bar
+    _container = True
 
     show = ConfigProperty()
 
@@ -376,6 +553,7 @@ class MenuBar(SmartDependant):
 
 class Menu(SmartDependant):
     _func = dpg.add_menu
+    _container = True
 
     label = ConfigProperty()
     show = ConfigProperty()
@@ -400,6 +578,7 @@ class Menu(SmartDependant):
 
 class TabBar(SmartDependant):
     _func = dpg.add_tab_bar
+    _container = True
 
     reorderable = ConfigProperty()
     callback = ConfigProperty()
@@ -428,6 +607,7 @@ class TabBar(SmartDependant):
 
 class Tab(SmartDependant):
     _func = dpg.add_tab
+    _container = True
 
     closable = ConfigProperty()
     label = ConfigProperty()
@@ -467,6 +647,7 @@ class Tab(SmartDependant):
 
 class Popup(SmartDependant):
     _func = dpg.add_popup
+    _container = True
     _addl_config = ["popupparent"]
 
     mousebutton = ConfigProperty()
@@ -507,6 +688,7 @@ class Popup(SmartDependant):
 
 class Tooltip(SmartDependant):
     _func = dpg.add_tooltip
+    _container = True
     _addl_config = ["tipparent"]
 
     show = ConfigProperty()
@@ -534,6 +716,7 @@ class Tooltip(SmartDependant):
 
 class TreeNode(SmartDependant):
     _func = dpg.add_tree_node
+    _container = True
 
     show = ConfigProperty()
     tip = ConfigProperty()
@@ -574,6 +757,7 @@ class ManagedColumns(SmartDependant):
     left to right. If there aren't any vacant columns in existing rows, a new row
     will be created."""
     _func = dpg.add_managed_columns
+    _container = True
 
     columns = ConfigProperty()
     border = ConfigProperty()
@@ -0,0 +1,194 @@
+"""
+Callbacks that run in a thread or process pool.
+
+Wrap a handler with <in_executor> and pass it as an items' callback. When the
+item triggers it, the handler runs in the executor instead of on the render
+thread. The item is disabled (its <enabled> option) while calls are in flight,
+and results or exceptions are handed back on the render thread once per frame.
+
+    def load(sender, data):
+        return expensive_query()
+
+    Button(callback=in_executor(load, on_result=show_rows)).add()
+"""
+import sys
+import traceback
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Union
+
+from .bases import ConfigProperty, smartitem, on_frame
+
+
+__all__ = [
+    "ExecutorCallback",
+    "in_executor",
+    "deliver",
+]
+
+
+_executors = {}  # {"thread" | "process": shared executor}
+_completed = deque()  # (ExecutorCallback, sender, Future); appended from worker threads
+
+
+def _shared_executor(kind: str):
+    if kind not in _executors:
+        _executors[kind] = ThreadPoolExecutor() if kind == "thread" else ProcessPoolExecutor()
+
+    return _executors[kind]
+
+
+def deliver():
+    """Hands finished calls back to their <ExecutorCallback>. Runs once per
+    frame (see <on_frame>), on the render thread. Returns the number of 
+    calls handled."""
+    count = 0
+    while _completed:
+        callback, sender, future = _completed.popleft()
+        callback._finish(sender, future)
+        count += 1
+
+    return count
+
+
+class ExecutorCallback:
+    """
+    dearpygui callback that runs <func(sender, data)> in an executor.
+
+    Parameters:
+        func: The handler. Needs to be picklable when using a process pool.
+
+        executor: An <Executor>, or "thread"/"process" for a shared thread or
+        process pool.
+
+        max_concurrency: Maximum number of calls in flight at once. Calls made
+        while at the limit wait for a free slot.
+
+        cancel_superseded: If True, a new call cancels the calls still waiting
+        to run, and the results of the ones already running are dropped.
+
+        on_result: Called as <on_result(sender, result)> on the render thread
+        when a call finishes.
+
+        on_error: Called as <on_error(sender, exception)> on the render thread 
+        when a call raises. The traceback is printed if not provided.
+
+        busy: If True, the sending item is disabled while it has calls in flight.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        *,
+        executor: Union[Executor, str] = "thread",
+        max_concurrency: int = 1,
+        cancel_superseded: bool = True,
+        on_result: Callable = None,
+        on_error: Callable = None,
+        busy: bool = True,
+        ):
+        self.func = func
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.cancel_superseded = cancel_superseded
+        self.on_result = on_result
+        self.on_error = on_error
+        self.busy = busy
+
+        self._running = {}  # {Future: (generation, "sender")}
+        self._waiting = deque()  # (sender, data)
+        self._generation = 0  # results of older generations are dropped
+        self._senders = {}  # {"sender": calls in flight}
+        self._enabled = {}  # {"sender": enabled before it became busy}
+
+        self.__wrapped__ = func
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}({self.func!r})"
+
+    def __call__(self, sender: str, data: Any):
+        on_frame(deliver)
+
+        if self.cancel_superseded:
+            self._generation += 1
+            for waiting_sender, _ in self._waiting:
+                self._done(waiting_sender)
+            self._waiting.clear()
+            for future in [*self._running]:
+                if future.cancel():  # hadn't started yet
+                    self._done(self._running.pop(future)[1])
+
+        self._begin(sender)
+        if len(self._running) < self.max_concurrency:
+            self._submit(sender, data)
+        else:
+            self._waiting.append((sender, data))
+
+    @property
+    def in_flight(self):
+        """Number of calls running or waiting to run."""
+        return len(self._running) + len(self._waiting)
+
+    def _submit(self, sender, data):
+        executor = self.executor
+        if isinstance(executor, str):
+            executor = _shared_executor(executor)
+
+        future = executor.submit(self.func, sender, data)
+        self._running[future] = (self._generation, sender)
+        future.add_done_callback(lambda future: _completed.append((self, sender, future)))
+
+    def _finish(self, sender: str, future: Future):
+        if (running := self._running.pop(future, None)) is None:
+            return  # cancelled
+
+        generation = running[0]
+
+        if self._waiting and len(self._running) < self.max_concurrency:
+            self._submit(*self._waiting.popleft())
+
+        try:
+            if generation == self._generation and not future.cancelled():
+                if (exc := future.exception()) is not None:
+                    self._error(sender, exc)
+                elif self.on_result is not None:
+                    self.on_result(sender, future.result())
+        finally:
+            self._done(sender)
+
+    def _error(self, sender, exc):
+        if self.on_error is not None:
+            self.on_error(sender, exc)
+        else:
+            traceback.print_exception(type(exc), exc, exc.__traceback__, file=sys.stderr)
+
+    # busy state
+    def _begin(self, sender: str):
+        self._senders[sender] = self._senders.get(sender, 0) + 1
+        if self.busy and self._senders[sender] == 1 and (item := self._busy_item(sender)):
+            self._enabled[sender] = item.enabled
+            item.enabled = False
+
+    def _done(self, sender: str):
+        self._senders[sender] -= 1
+        if self._senders[sender] == 0:
+            del self._senders[sender]
+            if sender in self._enabled and (item := smartitem(sender)):
+                item.enabled = self._enabled.pop(sender)
+
+    @staticmethod
+    def _busy_item(sender: str):
+        item = smartitem(sender)
+        if item is not None and isinstance(getattr(item.__class__, "enabled", None), ConfigProperty):
+            return item
+
+        return None
+
+
+def in_executor(func: Callable = None, **options):
+    """Returns an <ExecutorCallback> for <func>. Accepts the same keyword 
+    arguments. Can also be used as a decorator, with or without arguments."""
+    if func is None:
+        return lambda func: ExecutorCallback(func, **options)
+
+    return ExecutorCallback(func, **options)
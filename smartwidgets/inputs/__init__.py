@@ -1,3 +1,9 @@
 from .input import *
 from .drag import *
 from .slider import *
+
+from . import input as _input, drag as _drag, slider as _slider
+
+# without this, the star imports above export the submodules
+# as well (i.e. <bases> would shadow <smartwidgets.bases>)
+__all__ = [*_input.__all__, *_drag.__all__, *_slider.__all__]
@@ -1,6 +1,9 @@
+from types import FunctionType
 from typing import Callable, Any, Union
 
-from ..bases import SmartObject, ConfigProperty, SmartDependant
+from .. import bases
+from ..backend import core as dpg
+from ..bases import SmartObject, ConfigProperty, SmartDependant, _is_coroutine_function
 
 
 class SmartInput(SmartDependant):
@@ -195,3 +198,102 @@ class _Drag(_Slider):  # 1 argument difference between drag and slider items
         )
 
         self.speed = speed
+
+
+def _numeric(value_type: type, size: int):
+    # (annotation, default) of <default_value> for items holding <size> numbers
+    if size == 1:
+        return value_type, value_type(0)
+
+    return list[value_type], [value_type(0)] * size
+
+
+def _generate(name: str, base: type, func: str, params: list, module: str):
+    """Returns a subclass of <base> named <name> that adds items with the
+    dearpygui command <func>. <params> are the (name, annotation, default)
+    keyword-only parameters of the class (after <id>). Parameters that aren't 
+    options of <base> are added as ConfigProperties.
+
+    <__init__> is compiled from source so that it has a real signature, and 
+    sets options without going through <base.__init__>. Classes with the same 
+    parameter names share the compiled code."""
+    options = [
+        param for param, _, _ in params 
+        if param not in ("label", "parent", "before", "default_value")
+    ]
+
+    namespace = {
+        "_func": getattr(dpg, func),
+        "__module__": module,
+        "__qualname__": name,
+        **{
+            option: ConfigProperty() 
+            for option in options if not hasattr(base, option)
+        },
+    }
+
+    init = _compile_init(tuple(param for param, _, _ in params), tuple(options))
+    init = FunctionType(init.__code__, init.__globals__, "__init__", init.__defaults__)
+    init.__kwdefaults__ = {param: default for param, _, default in params}
+    init.__annotations__ = {"id": str, **{param: annotation for param, annotation, _ in params}}
+    init.__module__ = module
+    init.__qualname__ = f"{name}.__init__"
+    namespace["__init__"] = init
+
+    return type(name, (base,), namespace)
+
+
+_inits = {}  # {(parameter names, option names): function}
+
+
+def _compile_init(params: tuple, options: tuple):
+    # <__init__> taking <params> as keyword-only arguments (their defaults and 
+    # annotations are set per class)
+    if (key := (params, options)) not in _inits:
+        values = ", ".join(f"{option!r}: {option}" for option in options)
+        source = (
+            f"def __init__(self, id=None, *, {', '.join(params)}):\n"
+            f"    _init(self, id, label, parent, before, default_value, {{{values}}})\n"
+        )
+        scope = {"_init": _init}
+        exec(source, scope)
+        _inits[key] = scope["__init__"]
+
+    return _inits[key]
+
+
+def _init(item, id, label, parent, before, default_value, options: dict):
+    # body of generated <__init__> methods
+    SmartDependant.__init__(item, id, label, parent, before)
+    item._default_value = default_value
+
+    callback = options.get("callback")
+    if (
+        item._compact 
+        or (bases._marshal is not None and item.is_valid)
+        or _is_coroutine_function(callback)
+    ):
+        for option, value in options.items():
+            setattr(item, option, value)
+    else:
+        # same as setting each option on an unrealized item
+        vars(item).update(options)
+
+
+def _params(common: list, value_type: type, size: int, extras: tuple = ()):
+    # the parameters of one class of a family, from the parameters the family 
+    # has in <common> ((name, annotation, default), where "value" stands in for 
+    # <value_type>). <extras> are added, or replace parameters of the same name
+    annotation, default = _numeric(value_type, size)
+
+    params = {}
+    for param, ann, default_ in common:
+        if param == "default_value":
+            ann, default_ = annotation, default
+        elif ann == "value":
+            ann, default_ = value_type, value_type(default_)
+        params[param] = (param, ann, default_)
+    for param in extras:
+        params[param[0]] = param
+
+    return [*params.values()]
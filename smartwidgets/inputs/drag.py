@@ -1,8 +1,6 @@
 from typing import Union, Any, Callable
 
-from dearpygui import core as dpg
-
-from .bases import SmartObject, SmartDependant, _Drag
+from .bases import SmartObject, SmartDependant, _Drag, _generate, _params
 
 
 __all__ = [
@@ -16,382 +14,41 @@ __all__ = [
     "DragFloat",
 ]
 
-# Aside from slightly different type-check, default
-# values, and <cls._func>, 99% of this is copy/paste.
-# Using **kwargs would mean that these wouldn't have 
-# signatures of their own.
-
-class DragInt4(_Drag):
-    _func = dpg.add_drag_int4
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: list[int] = [0, 0, 0, 0],
-        speed: float = 1.0, 
-        min_value: int = 0,
-        max_value: int = 100,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%d'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
-
-class DragInt3(_Drag):
-    _func = dpg.add_drag_int3
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: list[int] = [0, 0, 0],
-        speed: float = 1.0, 
-        min_value: int = 0,
-        max_value: int = 100,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%d'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
-
-class DragInt2(_Drag):
-    _func = dpg.add_drag_int2
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: list[int] = [0, 0],
-        speed: float = 1.0, 
-        min_value: int = 0,
-        max_value: int = 100,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%d'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
-
-class DragInt(_Drag):
-    _func = dpg.add_drag_int
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: int = 0,
-        speed: float = 1.0, 
-        min_value: int = 0,
-        max_value: int = 100,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%d'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
-
-class DragFloat4(_Drag):
-    _func = dpg.add_drag_float4
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: list[float] = [0.0, 0.0, 0.0, 0.0],
-        speed: float = 1.0, 
-        min_value: float = 0.0,
-        max_value: float = 100.0,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%0.3f'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
-
-class DragFloat3(_Drag):
-    _func = dpg.add_drag_float3
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: list[float] = [0.0, 0.0, 0.0],
-        speed: float = 1.0, 
-        min_value: float = 0.0,
-        max_value: float = 100.0,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%0.3f'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
-
-class DragFloat2(_Drag):
-    _func = dpg.add_drag_float2
-
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: list[float] = [0.0, 0.0],
-        speed: float = 1.0, 
-        min_value: float = 0.0,
-        max_value: float = 100.0,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%0.3f'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
-
+# (name, annotation, default) of the parameters shared by drag items,
+# where "value" is the type of the number(s) the item holds
+_PARAMS = [
+    ("label", str, ""),
+    ("parent", Union[str, SmartObject], ""),
+    ("before", Union[str, SmartDependant], ""),
+    ("default_value", None, None),
+    ("speed", float, 1.0),
+    ("min_value", "value", 0),
+    ("max_value", "value", 100),
+    ("width", int, 0),
+    ("callback", Callable, None),
+    ("callback_data", Any, None),
+    ("no_input", bool, False),
+    ("clamped", bool, False),
+    ("enabled", bool, True),
+    ("source", str, ""),
+    ("tip", str, ""),
+    ("show", bool, True),
+    ("format", str, "%d"),
+]
 
-class DragFloat(_Drag):
-    _func = dpg.add_drag_float
+_CLASSES = [
+    # name, dearpygui command, number type, numbers held, other parameters
+    ("DragInt4", "add_drag_int4", int, 4, ()),
+    ("DragInt3", "add_drag_int3", int, 3, ()),
+    ("DragInt2", "add_drag_int2", int, 2, ()),
+    ("DragInt", "add_drag_int", int, 1, ()),
+    ("DragFloat4", "add_drag_float4", float, 4, (("format", str, "%0.3f"),)),
+    ("DragFloat3", "add_drag_float3", float, 3, (("format", str, "%0.3f"),)),
+    ("DragFloat2", "add_drag_float2", float, 2, (("format", str, "%0.3f"),)),
+    ("DragFloat", "add_drag_float", float, 1, (("format", str, "%0.3f"),)),
+]
 
-    def __init__(
-        self,
-        id: str = None, 
-        *, 
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "",
-        default_value: float = 0.0,
-        speed: float = 1.0, 
-        min_value: float = 0.0,
-        max_value: float = 100.0,
-        width: int = 0,
-        callback: Callable = None,
-        callback_data: Any = None,
-        no_input: bool = False,
-        clamped: bool = False,
-        enabled: bool = True,
-        source: str = "",
-        tip: str = "",
-        show: bool = True,
-        format: str = '%0.3f'
-        ):
-        super().__init__(
-            id=id, 
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            source=source,
-            speed=speed,
-            no_input=no_input,
-            clamped=clamped,
-            tip=tip,
-            show=show,
-            format=format,
-            )
+# generated from the table above, since they only differ by their
+# command and defaults (see drag.pyi for their signatures)
+for _name, _func, _type, _size, _extras in _CLASSES:
+    globals()[_name] = _generate(_name, _Drag, _func, _params(_PARAMS, _type, _size, _extras), __name__)
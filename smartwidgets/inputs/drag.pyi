@@ -0,0 +1,215 @@
+from typing import Union, Any, Callable
+
+from .bases import SmartInput, SmartObject, SmartDependant, ConfigProperty, _Drag
+
+
+__all__ = [
+    "DragInt4",
+    "DragInt3",
+    "DragInt2",
+    "DragInt",
+    "DragFloat4",
+    "DragFloat3",
+    "DragFloat2",
+    "DragFloat",
+]
+
+
+class DragInt4(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0, 0, 0],
+        speed: float = 1.0,
+        min_value: int = 0,
+        max_value: int = 100,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class DragInt3(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0, 0],
+        speed: float = 1.0,
+        min_value: int = 0,
+        max_value: int = 100,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class DragInt2(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0],
+        speed: float = 1.0,
+        min_value: int = 0,
+        max_value: int = 100,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class DragInt(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: int = 0,
+        speed: float = 1.0,
+        min_value: int = 0,
+        max_value: int = 100,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class DragFloat4(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0, 0.0, 0.0],
+        speed: float = 1.0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%0.3f",
+    ) -> None: ...
+
+
+class DragFloat3(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0, 0.0],
+        speed: float = 1.0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%0.3f",
+    ) -> None: ...
+
+
+class DragFloat2(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0],
+        speed: float = 1.0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%0.3f",
+    ) -> None: ...
+
+
+class DragFloat(_Drag):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: float = 0.0,
+        speed: float = 1.0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        width: int = 0,
+        callback: Callable = None,
+        callback_data: Any = None,
+        no_input: bool = False,
+        clamped: bool = False,
+        enabled: bool = True,
+        source: str = "",
+        tip: str = "",
+        show: bool = True,
+        format: str = "%0.3f",
+    ) -> None: ...
@@ -1,8 +1,8 @@
 from typing import Union, Any, Callable
 
-from dearpygui import core as dpg
+from ..backend import core as dpg
 
-from .bases import SmartInput, SmartObject, SmartDependant, ConfigProperty, _Input
+from .bases import SmartInput, SmartObject, SmartDependant, ConfigProperty, _Input, _generate, _params
 
 
 __all__ = [
@@ -17,429 +17,56 @@ __all__ = [
     "InputText",
 ]
 
-# Aside from slightly different type-check, default
-# values, and <cls._func>, 99% of this is copy/paste.
-# Using **kwargs would mean that these wouldn't have 
-# signatures of their own.
-
-
-class InputInt4(_Input):
-    _func = dpg.add_input_int4
-   
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: list[int] = [0, 0, 0, 0],
-        width: int = 0,
-        min_value: int = 0, 
-        max_value: int = 100, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly
-            )
-
-
-class InputInt3(_Input):
-    _func = dpg.add_input_int3
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: list[int] = [0, 0, 0],
-        width: int = 0,
-        min_value: int = 0, 
-        max_value: int = 100, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly
-            )
-
-
-class InputInt2(_Input):
-    _func = dpg.add_input_int2
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: list[int] = [0, 0],
-        width: int = 0,
-        min_value: int = 0, 
-        max_value: int = 100, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly
-            )
-
-
-class InputInt(_Input):
-    _func = dpg.add_input_int
-
-    step = ConfigProperty()
-    step_fast = ConfigProperty()
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: int = 0,
-        width: int = 0,
-        min_value: int = 0, 
-        max_value: int = 100, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        step: int = 1,
-        step_fast: int = 100,
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly
-            )
-
-        self.step = step if step is not None else 1
-        self.step_fast = step_fast if step_fast is not None else 1
-
-
-# float
-class InputFloat4(_Input):
-    _func = dpg.add_input_float4
-
-    format = ConfigProperty()
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: list[float] = [0.0, 0.0, 0.0, 0.0],
-        width: int = 0,
-        min_value: float = 0.0, 
-        max_value: float = 100.0, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        format: str = "%.3f",
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly,
-            )
-        
-        self.format = format
-
-
-class InputFloat3(_Input):
-    _func = dpg.add_input_float3
-
-    format = ConfigProperty()
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: list[float] = [0.0, 0.0, 0.0],
-        width: int = 0,
-        min_value: float = 0.0, 
-        max_value: float = 100.0, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        format: str = "%.3f",
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly,
-            )
-        
-        self.format = format
-
-
-class InputFloat2(_Input):
-    _func = dpg.add_input_float2
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: list[float] = [0.0, 0.0],
-        width: int = 0,
-        min_value: float = 0.0, 
-        max_value: float = 100.0, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        format: str = "%.3f",
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly,
-            )
-
-        self.format = format
-
-
-class InputFloat(_Input):
-    _func = dpg.add_input_float
-
-    step = ConfigProperty()
-    step_fast = ConfigProperty()
-
-    format = ConfigProperty()
-
-    def __init__(
-        self, 
-        id: str = None,
-        *, 
-        source: str = "",
-        label: str = "", 
-        parent: Union[str, SmartObject] = "", 
-        before: Union[str, SmartDependant] = "", 
-        default_value: float = 0.0,
-        width: int = 0,
-        min_value: float = 0.0, 
-        max_value: float = 100.0, 
-        min_clamped: bool = False,
-        max_clamped: bool = False,
-        callback: Callable = None, 
-        callback_data: Any = None, 
-        enabled: bool = True, 
-        on_enter: bool = False,
-        tip: str = "", 
-        show: bool = True,
-        readonly: bool = False,
-        format: str = "%.3f",
-        step: float = 0.1,
-        step_fast: float = 1.0,
-        ):
-        super().__init__(
-            id=id, 
-            source=source,
-            label=label, 
-            parent=parent, 
-            before=before,
-            default_value=default_value,
-            width=width,
-            min_value=min_value,
-            max_value=max_value,
-            min_clamped=min_clamped,
-            max_clamped=max_clamped,
-            callback=callback,
-            callback_data=callback_data,
-            enabled=enabled,
-            on_enter=on_enter,
-            tip=tip,
-            show=show,
-            readonly=readonly,
-            )
-        
-        self.format = format
+# (name, annotation, default) of the parameters shared by the numeric
+# inputs, where "value" is the type of the number(s) the item holds
+_PARAMS = [
+    ("source", str, ""),
+    ("label", str, ""),
+    ("parent", Union[str, SmartObject], ""),
+    ("before", Union[str, SmartDependant], ""),
+    ("default_value", None, None),
+    ("width", int, 0),
+    ("min_value", "value", 0),
+    ("max_value", "value", 100),
+    ("min_clamped", bool, False),
+    ("max_clamped", bool, False),
+    ("callback", Callable, None),
+    ("callback_data", Any, None),
+    ("enabled", bool, True),
+    ("on_enter", bool, False),
+    ("tip", str, ""),
+    ("show", bool, True),
+    ("readonly", bool, False),
+]
 
-        self.step = step if step is not None else 0.1
-        self.step_fast = step_fast if step_fast is not None else 1.0
+_CLASSES = [
+    # name, dearpygui command, number type, numbers held, other parameters
+    ("InputInt4", "add_input_int4", int, 4, ()),
+    ("InputInt3", "add_input_int3", int, 3, ()),
+    ("InputInt2", "add_input_int2", int, 2, ()),
+    ("InputInt", "add_input_int", int, 1, (
+        ("step", int, 1), 
+        ("step_fast", int, 100),
+    )),
+    ("InputFloat4", "add_input_float4", float, 4, (("format", str, "%.3f"),)),
+    ("InputFloat3", "add_input_float3", float, 3, (("format", str, "%.3f"),)),
+    ("InputFloat2", "add_input_float2", float, 2, (("format", str, "%.3f"),)),
+    ("InputFloat", "add_input_float", float, 1, (
+        ("format", str, "%.3f"), 
+        ("step", float, 0.1), 
+        ("step_fast", float, 1.0),
+    )),
+]
 
+# generated from the table above, since they only differ by their
+# command and defaults (see input.pyi for their signatures)
+for _name, _func, _type, _size, _extras in _CLASSES:
+    globals()[_name] = _generate(_name, _Input, _func, _params(_PARAMS, _type, _size, _extras), __name__)
 
 
-# VASTLY different params
-# the only Input item that doesnt inherit from_Input
 class InputText(SmartInput):
     _func = dpg.add_input_text
-    _addl_config = ["multiline"]
+    _addl_config = ["before", "parent", "default_value", "multiline"]
 
     width = ConfigProperty()
     height = ConfigProperty()
@@ -0,0 +1,290 @@
+from typing import Union, Any, Callable
+
+from .bases import SmartInput, SmartObject, SmartDependant, ConfigProperty, _Input
+
+
+__all__ = [
+    "InputInt4",
+    "InputInt3",
+    "InputInt2",
+    "InputInt",
+    "InputFloat4",
+    "InputFloat3",
+    "InputFloat2",
+    "InputFloat",
+    "InputText",
+]
+
+
+class InputInt4(_Input):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0, 0, 0],
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+    ) -> None: ...
+
+
+class InputInt3(_Input):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0, 0],
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+    ) -> None: ...
+
+
+class InputInt2(_Input):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0],
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+    ) -> None: ...
+
+
+class InputInt(_Input):
+    step: ConfigProperty
+    step_fast: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: int = 0,
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+        step: int = 1,
+        step_fast: int = 100,
+    ) -> None: ...
+
+
+class InputFloat4(_Input):
+    format: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0, 0.0, 0.0],
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+        format: str = "%.3f",
+    ) -> None: ...
+
+
+class InputFloat3(_Input):
+    format: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0, 0.0],
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+        format: str = "%.3f",
+    ) -> None: ...
+
+
+class InputFloat2(_Input):
+    format: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0],
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+        format: str = "%.3f",
+    ) -> None: ...
+
+
+class InputFloat(_Input):
+    format: ConfigProperty
+    step: ConfigProperty
+    step_fast: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: float = 0.0,
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        min_clamped: bool = False,
+        max_clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        on_enter: bool = False,
+        tip: str = "",
+        show: bool = True,
+        readonly: bool = False,
+        format: str = "%.3f",
+        step: float = 0.1,
+        step_fast: float = 1.0,
+    ) -> None: ...
+
+
+class InputText(SmartInput):
+    width: ConfigProperty
+    height: ConfigProperty
+    hint: ConfigProperty
+    no_spaces: ConfigProperty
+    uppercase: ConfigProperty
+    label: ConfigProperty
+    tab_input: ConfigProperty
+    decimal: ConfigProperty
+    hexadecimal: ConfigProperty
+    readonly: ConfigProperty
+    password: ConfigProperty
+    scientific: ConfigProperty
+    callback: ConfigProperty
+    callback_data: ConfigProperty
+    source: ConfigProperty
+    enabled: ConfigProperty
+    tip: ConfigProperty
+    show: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: str = "",
+        width: int = 0,
+        height: int = 0,
+        hint: str = "",
+        multiline: bool = False,
+        no_spaces: bool = False,
+        uppercase: bool = False,
+        tab_input: bool = False,
+        decimal: bool = False,
+        hexadecimal: bool = False,
+        readonly: bool = False,
+        password: bool = False,
+        scientific: bool = False,
+        on_enter: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+    ) -> None: ...
+
+    @property
+    def multiline(self) -> bool: ...
@@ -0,0 +1,217 @@
+from typing import Union, Any, Callable
+
+from .bases import SmartInput, SmartObject, SmartDependant, ConfigProperty, _Slider
+
+
+__all__ = [
+    "SliderInt4",
+    "SliderInt3",
+    "SliderInt2",
+    "SliderInt",
+    "SliderFloat4",
+    "SliderFloat3",
+    "SliderFloat2",
+    "SliderFloat",
+]
+
+
+class SliderInt4(_Slider):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0, 0, 0],
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class SliderInt3(_Slider):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0, 0],
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class SliderInt2(_Slider):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[int] = [0, 0],
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%d",
+    ) -> None: ...
+
+
+class SliderInt(_Slider):
+    height: ConfigProperty
+    vertical: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: int = 0,
+        width: int = 0,
+        min_value: int = 0,
+        max_value: int = 100,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%d",
+        height: int = 0,
+        vertical: bool = False,
+    ) -> None: ...
+
+
+class SliderFloat4(_Slider):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0, 0.0, 0.0],
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%.3f",
+    ) -> None: ...
+
+
+class SliderFloat3(_Slider):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0, 0.0],
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%.3f",
+    ) -> None: ...
+
+
+class SliderFloat2(_Slider):
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: list[float] = [0.0, 0.0],
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%.3f",
+    ) -> None: ...
+
+
+class SliderFloat(_Slider):
+    height: ConfigProperty
+    vertical: ConfigProperty
+
+    def __init__(
+        self,
+        id: str = None,
+        *,
+        source: str = "",
+        label: str = "",
+        parent: Union[str, SmartObject] = "",
+        before: Union[str, SmartDependant] = "",
+        default_value: float = 0.1,
+        width: int = 0,
+        min_value: float = 0.0,
+        max_value: float = 100.0,
+        clamped: bool = False,
+        callback: Callable = None,
+        callback_data: Any = None,
+        enabled: bool = True,
+        tip: str = "",
+        show: bool = True,
+        no_input: bool = False,
+        format: str = "%.3f",
+        height: int = 0,
+        vertical: bool = False,
+    ) -> None: ...
@@ -0,0 +1,229 @@
+"""
+Opt-in instrumentation of the dearpygui calls made by smartwidgets.
+
+While enabled, the current backend is wrapped so every call is counted and
+timed, and attributed to the widget class, item id, property and calling site
+(the first frame outside of smartwidgets) that made it. Nothing is wrapped
+while disabled, so there is no overhead.
+
+    stats = instrument.enable()
+    ...
+    print(stats.summary())
+    instrument.disable()
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from .backend import Backend, get_backend, set_backend
+from .bases import on_frame, off_frame
+
+
+__all__ = [
+    "CallStats",
+    "InstrumentedBackend",
+    "enable",
+    "disable",
+    "instrumented",
+    "stats",
+]
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class CallStats:
+    """
+    Counts and cumulative time (in seconds) of backend calls. Each attribute
+    maps a key to a [count, seconds] list:
+        calls: Backend function name (i.e. "get_item_configuration").
+        classes: Name of the widget class the call was made for.
+        items: Id of the item the call was made for.
+        properties: Property or method that made the call (i.e. "width",
+        "parent", "children").
+        sites: "filename:line" of the code outside of smartwidgets that 
+        triggered the call.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.calls = {}
+        self.classes = {}
+        self.items = {}
+        self.properties = {}
+        self.sites = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(count={self.count}, time={self.time:.6f})"
+
+    def record(self, call: str, cls: str, item: str, prop: str, site: str, elapsed: float):
+        self.count += 1
+        self.time += elapsed
+        for table, key in (
+            (self.calls, call),
+            (self.classes, cls),
+            (self.items, item),
+            (self.properties, prop),
+            (self.sites, site),
+        ):
+            if key is None:
+                continue
+            if (entry := table.get(key)) is None:
+                table[key] = [1, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+
+    def reset(self):
+        self.__init__()
+
+    def top(self, by: str = "calls", n: int = 10, key: str = "count"):
+        """Returns the <n> largest entries of the <by> table, sorted by 
+        "count" or "time"."""
+        index = 0 if key == "count" else 1
+        return sorted(
+            getattr(self, by).items(), key=lambda entry: entry[1][index], reverse=True
+        )[:n]
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "time": self.time,
+            "calls": self.calls,
+            "classes": self.classes,
+            "items": self.items,
+            "properties": self.properties,
+            "sites": self.sites,
+        }
+
+    def summary(self, n: int = 10):
+        """Returns a printable summary of the <n> heaviest entries in each table."""
+        lines = [f"{self.count} calls, {self.time * 1e3:.3f} ms"]
+        for table in ("calls", "classes", "properties", "items", "sites"):
+            lines.append(f"  by {table}:")
+            for key, (count, elapsed) in self.top(table, n):
+                lines.append(f"    {count:>8} {elapsed * 1e3:>10.3f} ms  {key}")
+
+        return "\n".join(lines)
+
+
+def _attribute(frame):
+    # (class name, item id, property, site) of the smartwidgets 
+    # code that made the call
+    from .bases import _SmartObject, ConfigProperty
+
+    item = prop = site = None
+    while frame is not None:
+        code = frame.f_code
+        if not code.co_filename.startswith(_PACKAGE_DIR):
+            site = f"{code.co_filename}:{frame.f_lineno}"
+            break
+
+        if item is None:
+            local = frame.f_locals
+            owner = local.get("self")
+            if isinstance(owner, ConfigProperty) and isinstance(local.get("instance"), _SmartObject):
+                item, prop = local["instance"], owner.name
+            elif isinstance(owner, _SmartObject):
+                item, prop = owner, code.co_name
+
+        frame = frame.f_back
+
+    if item is None:
+        return None, None, None, site
+
+    return item.__class__.__name__, getattr(item, "id", None), prop, site
+
+
+class InstrumentedBackend(Backend):
+    """Wraps another backend, recording every call made to it in <stats>,
+    and in <frame_stats> which is reset every frame."""
+
+    def __init__(self, backend: Backend):
+        self.backend = backend
+        self.name = backend.name
+        self.stats = CallStats()
+        self.frame_stats = CallStats()
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        func = getattr(self.backend, name)
+        perf_counter = time.perf_counter
+
+        def instrumented(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                # skip this frame and <core>'s forwarding frame
+                context = _attribute(sys._getframe(2))
+                self.stats.record(name, *context, elapsed)
+                self.frame_stats.record(name, *context, elapsed)
+
+        setattr(self, name, instrumented)
+
+        return instrumented
+
+
+_per_frame: Callable = None
+
+
+def _end_frame():
+    backend = get_backend()
+    if isinstance(backend, InstrumentedBackend):
+        if _per_frame is not None:
+            _per_frame(backend.frame_stats)
+        backend.frame_stats = CallStats()
+
+
+def enable(per_frame: Callable[[CallStats], None] = None):
+    """Starts instrumenting backend calls, returning the live <CallStats>.
+    If <per_frame> is provided, it is called with the stats of each frame 
+    when the frame ends (see <on_frame>)."""
+    global _per_frame
+    _per_frame = per_frame
+
+    if not isinstance((backend := get_backend()), InstrumentedBackend):
+        set_backend(backend := InstrumentedBackend(backend))
+
+    on_frame(_end_frame)
+
+    return backend.stats
+
+
+def disable():
+    """Stops instrumenting backend calls. Returns the final <CallStats>,
+    or None if instrumentation wasn't enabled."""
+    global _per_frame
+    _per_frame = None
+    off_frame(_end_frame)
+
+    if isinstance((backend := get_backend()), InstrumentedBackend):
+        set_backend(backend.backend)
+        return backend.stats
+
+    return None
+
+
+@contextmanager
+def instrumented(per_frame: Callable[[CallStats], None] = None):
+    """Context manager. Instruments backend calls made in the block, 
+    yielding the live <CallStats>."""
+    try:
+        yield enable(per_frame)
+    finally:
+        disable()
+
+
+def stats():
+    """Returns the live <CallStats>, or None if instrumentation is disabled."""
+    if isinstance((backend := get_backend()), InstrumentedBackend):
+        return backend.stats
+
+    return None
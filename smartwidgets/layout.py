@@ -0,0 +1,210 @@
+"""
+Declarative layouts.
+
+A layout spec describes a tree of items as nested dictionaries, where "type"
+names a smartwidgets class, "children" lists the items it holds, and every
+other key is passed to the class as an option:
+
+    {
+        "type": "Window",
+        "label": "Main",
+        "children": [
+            {"type": "Group", "horizontal": True, "children": [
+                {"type": "Text", "default_value": "Name"},
+                {"type": "InputText"},
+            ]},
+        ],
+    }
+
+Specs can also be JSON or YAML (requires PyYAML) strings or files. <compile_spec>
+turns a spec into a cached <BuildPlan>: a flat list of (function, options)
+steps computed once. Realizing the plan only issues the add_* and end calls, 
+so the same layout can be built repeatedly without running any constructors.
+"""
+import os
+import json
+from typing import Union
+
+from .backend import core as dpg
+from .bases import (
+    _SmartObject, 
+    SmartObject, 
+    reserve_ids, 
+    _smartitems, 
+    _release, 
+    _link, 
+    _open_parent,
+)
+
+
+__all__ = [
+    "BuildPlan",
+    "load",
+    "compile_spec",
+    "build",
+]
+
+
+_plans = {}  # {spec key: BuildPlan}
+
+
+def load(source: Union[dict, list, str]):
+    """Returns the spec in <source>, which can be a spec (returned as is), 
+    a JSON or YAML string, or the path of a .json, .yaml or .yml file."""
+    if not isinstance(source, str):
+        return source
+
+    text, ext = source, ""
+    if os.path.isfile(source):
+        ext = os.path.splitext(source)[1].lower()
+        with open(source) as file:
+            text = file.read()
+
+    if ext in (".yaml", ".yml") or (not ext and not text.lstrip().startswith(("{", "["))):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required to load YAML layout specs.") from None
+
+        return yaml.safe_load(text)
+
+    return json.loads(text)
+
+
+def _item_classes():
+    # {"class name": class} for every class that adds an item
+    from . import containers, buttons, widgets, node, inputs  # registers the classes
+
+    classes = {}
+    pending = [_SmartObject]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls._func is not None and not cls._compact:
+            classes.setdefault(cls.__name__, cls)
+
+    return classes
+
+
+def _spec_key(spec):
+    # callables (i.e. callbacks) can't be serialized, so they're keyed by identity
+    return json.dumps(spec, sort_keys=True, default=lambda obj: f"<{type(obj).__name__} {id(obj)}>")
+
+
+class BuildPlan:
+    """
+    Flat list of build steps compiled from a layout spec.
+
+    Attributes:
+        steps: [(prototype, options), ...] in the order items are added, where
+        (None, None) ends the last containers' stack. Prototypes are unrealized 
+        items holding the Python-side configuration of each item.
+    """
+
+    def __init__(self, steps: list):
+        self.steps = steps
+        self._counts = {}  # {class: items per realization}
+        self._templates = []  # see <_SmartObject._template>
+        for prototype, _ in steps:
+            if prototype is not None:
+                cls = prototype.__class__
+                self._counts[cls] = self._counts.get(cls, 0) + 1
+            self._templates.append(prototype and prototype._template())
+
+    def __len__(self):
+        return sum(self._counts.values())
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(items={len(self)})"
+
+    def realize(self, parent: Union[str, SmartObject] = None, *, bind: bool = True, copies: int = 1):
+        """Adds the items of the plan to dearpygui <copies> times, with new ids
+        (reserved in one block per class). Top-level items are added to <parent>
+        if provided (otherwise the container stack is used, same as <add>). If 
+        <bind> is True, a SmartObject is registered for each item. Returns the 
+        top-level items (or their ids if <bind> is False)."""
+        ids = {
+            cls: iter(reserve_ids(cls, count * copies)) 
+            for cls, count in self._counts.items()
+        }
+        steps = [*zip(self.steps, self._templates)]
+
+        roots = []
+        for _ in range(copies):
+            stack = [str(parent) if parent else ""]
+            for (prototype, options), template in steps:
+                if prototype is None:
+                    dpg.end()
+                    stack.pop()
+                    continue
+
+                id = next(ids[prototype.__class__])
+                if len(stack) == 1 and stack[0] and "parent" in options:
+                    prototype._func(name=id, **{**options, "parent": stack[0]})
+                else:
+                    prototype._func(name=id, **options)
+
+                if len(stack) > 1:
+                    _link(id, stack[-1])
+                elif "parent" not in options:
+                    _link(id, "")
+                else:
+                    _link(id, stack[0] or options["parent"] or _open_parent(id), options.get("before", ""))
+
+                item = prototype._copy_as(id, stack[-1], template) if bind else id
+                if len(stack) == 1:
+                    roots.append(item)
+                if prototype._container:
+                    stack.append(id)
+
+        return roots
+
+
+def compile_spec(spec: Union[dict, list, str]):
+    """Compiles a layout spec (see <load>) into a <BuildPlan>. Plans are cached, 
+    so compiling the same spec again is cheap."""
+    spec = load(spec)
+    if (key := _spec_key(spec)) in _plans:
+        return _plans[key]
+
+    classes = _item_classes()
+
+    steps = []
+    pending = [*reversed(spec if isinstance(spec, list) else [spec])]
+    while pending:
+        if (node := pending.pop()) is None:
+            steps.append((None, None))
+            continue
+
+        node = dict(node)
+        name = node.pop("type", None)
+        children = node.pop("children", ())
+        if name not in classes:
+            raise ValueError(f"Unknown item type '{name}'.")
+
+        prototype = classes[name](**node)
+        if children and not prototype._container:
+            raise ValueError(f"'{name}' items can't have children.")
+
+        options = prototype.configuration()
+        if "label" not in node and options.get("label") == prototype.id:
+            del options["label"]  # defaults to the items' name
+
+        # prototypes are templates - they aren't items themselves
+        _smartitems.pop(prototype.id, None)
+        _release(prototype.id)
+
+        steps.append((prototype, options))
+        if prototype._container:
+            pending.append(None)
+            pending.extend(reversed(children))
+
+    _plans[key] = plan = BuildPlan(steps)
+
+    return plan
+
+
+def build(spec: Union[dict, list, str], parent: Union[str, SmartObject] = None, *, bind: bool = True):
+    """Compiles (or fetches the cached plan of) <spec> and realizes it. See 
+    <BuildPlan.realize>."""
+    return compile_spec(spec).realize(parent, bind=bind)
@@ -1,6 +1,6 @@
 from typing import Any, Callable
 
-from dearpygui import core as dpg
+from .backend import core as dpg
 
 from .bases import SmartDependant, ConfigProperty
 
@@ -14,6 +14,7 @@ __all__ = [
 
 class NodeEditor(SmartDependant):
     _func = dpg.add_node_editor
+    _container = True
     _addl_config = ['before', 'link_callback', 'delink_callback']
 
     show = ConfigProperty()
@@ -46,6 +47,7 @@ class NodeEditor(SmartDependant):
 
 class Node(SmartDependant):
     _func = dpg.add_node
+    _container = True
 
     show: bool = ConfigProperty()
     draggable: bool = ConfigProperty()
@@ -73,6 +75,7 @@ class Node(SmartDependant):
 
 class NodeAttribute(SmartDependant):
     _func = dpg.add_node_attribute
+    _container = True
     
     show = ConfigProperty()
     output = ConfigProperty()
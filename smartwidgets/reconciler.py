@@ -0,0 +1,182 @@
+"""
+Incremental updates of live item trees.
+
+<reconcile> takes the desired children of a live container, described the same
+way as layout specs (see <smartwidgets.layout>), and updates the items that
+already exist instead of rebuilding them. "type" can also be a smartwidgets
+class, and a "key" can be given to match items in lists:
+
+    reconcile(window, [
+        {"type": Text, "key": row.id, "default_value": row.name}
+        for row in rows
+    ])
+
+Live items are matched to the spec by key, or else by type and position. Only
+the options that differ from the items' live configuration are sent to 
+dearpygui (one <configure_item> per item, and <set_value> for a changed 
+"default_value"), matched items that are out of order are moved, unmatched 
+items are deleted and new ones are added. Items that are kept keep their 
+dearpygui state (scroll position, focus, open tree nodes, etc.), except for 
+items whose options can't be changed once added (i.e. InputText's 
+"multiline"), which are created again.
+"""
+from typing import Union
+
+from . import bases
+from .backend import core as dpg
+from .bases import (
+    ConfigProperty, 
+    SmartObject, 
+    smartitem, 
+    _SPECIAL_CONFIG, 
+    snapshot,
+    _child_ids,
+    _stable,
+)
+
+
+__all__ = [
+    "reconcile",
+]
+
+
+_RESERVED = ("type", "children", "key")
+_UNSET = object()
+
+
+def _item_class(node: dict):
+    cls = node.get("type")
+    if isinstance(cls, type):
+        return cls
+
+    from .layout import _item_classes
+    if (classes := _item_classes()).get(cls) is None:
+        raise ValueError(f"Unknown item type '{cls}'.")
+
+    return classes[cls]
+
+
+def _options(node: dict):
+    return {
+        opt: str(value) if isinstance(value, SmartObject) else value
+        for opt, value in node.items() if opt not in _RESERVED
+    }
+
+
+def _update(item: SmartObject, options: dict):
+    # sends the options that differ from the items' live configuration, 
+    # batching the plain ones into one call. Returns False (sending nothing)
+    # if an option that can't be changed once the item is added differs, 
+    # in which case the item needs to be created again
+    cls = item.__class__
+    config = snapshot(item)[item.id]
+
+    plain, other, value = {}, {}, _UNSET
+    for opt, new in options.items():
+        desc = getattr(cls, opt, None)
+        if opt in ("parent", "before"):
+            continue  # <reconcile> places the item
+        elif opt == "default_value":
+            if dpg.get_value(item.id) != new:
+                value = new
+        elif isinstance(desc, ConfigProperty) and opt not in _SPECIAL_CONFIG:
+            if config.get(opt, _UNSET) != new:
+                plain[opt] = new
+        elif getattr(item, opt, _UNSET) == new:
+            continue
+        elif isinstance(desc, ConfigProperty) or (isinstance(desc, property) and desc.fset):
+            other[opt] = new
+        else:
+            return False
+
+    # write-back mode batches them already
+    if bases._writeback:
+        other.update(plain)
+    elif plain:
+        for opt, new in plain.items():
+            getattr(cls, opt)._store(item, new)
+        dpg.configure_item(item.id, **plain)
+    for opt, new in other.items():
+        setattr(item, opt, new)
+    if value is not _UNSET:
+        dpg.set_value(item.id, value)
+        item._default_value = value
+
+    return True
+
+
+def _create(cls: type, options: dict, parent: str, before: str):
+    item = cls(**options)
+    if "parent" in item.options():
+        item.parent = parent
+        item.before = before
+    item.add()
+    if item._container:
+        item.end()
+
+    return item
+
+
+def reconcile(parent: Union[str, SmartObject], spec: Union[dict, list]):
+    """Updates the children of <parent> (a live container) to match <spec> (a
+    node or list of nodes), recursively. Options left out of a node are left
+    as they are on matched items. Children that aren't smartwidgets items are
+    left alone. Returns the items matching the top-level nodes, in order."""
+    parent = str(parent)
+    nodes = spec if isinstance(spec, list) else [spec]
+
+    keyed, unkeyed = {}, {}
+    live = [item for child in _child_ids(parent) if (item := smartitem(child))]
+    for item in live:
+        if (key := getattr(item, "_key", None)) is not None:
+            keyed[key] = item
+        else:
+            unkeyed.setdefault(item.__class__, []).append(item)
+    for items in unkeyed.values():
+        items.reverse()  # popped in order
+
+    # match
+    matches = []
+    for node in nodes:
+        cls = _item_class(node)
+        if (key := node.get("key")) is not None:
+            item = keyed.pop(key, None)
+            if item is not None and item.__class__ is not cls:
+                keyed[key] = item  # replaced by a different type
+                item = None
+        else:
+            item = (unkeyed.get(cls) or [None]).pop()
+        matches.append((cls, item))
+
+    kept = {id(item) for _, item in matches if item is not None}
+    for item in live:
+        if id(item) not in kept:
+            item.delete()
+
+    # items that are already in order stay where they are
+    order = {id(item): index for index, item in enumerate(live)}
+    matched = [index for index, (_, item) in enumerate(matches) if item is not None]
+    stable = {matched[i] for i in _stable([order[id(matches[i][1])] for i in matched])}
+
+    results = [None] * len(nodes)
+    following = ""
+    for index in reversed(range(len(nodes))):
+        node, (cls, item) = nodes[index], matches[index]
+        options = _options(node)
+        if item is None:
+            item = _create(cls, options, parent, str(following))
+        else:
+            if not _update(item, options):
+                item.delete()
+                item = _create(cls, options, parent, str(following))
+            elif index not in stable:
+                item.move(parent, following)
+
+        if (key := node.get("key")) is not None:
+            item._key = key
+        if item._container and ("children" in node or item is not matches[index][1]):
+            reconcile(item, node.get("children", []))
+
+        results[index] = following = item
+
+    return results
@@ -0,0 +1,101 @@
+"""
+Marshaling of updates made from threads other than the render thread.
+
+While enabled, <ConfigProperty> writes to realized items and 
+<ValueStorageProxy.set> calls made from any other thread are queued instead 
+of calling into dearpygui. Unrealized items are written to directly, so they 
+can still be built off the render thread (see <bases.deferred>). Writes
+are coalesced by (item, property) so only the latest one survives, and the
+queue is drained on the render thread once per frame.
+
+    threads.enable()  # from the render thread
+    worker = Thread(target=lambda: setattr(slider, "max_value", 10))
+"""
+import threading
+from typing import Any, Callable
+
+from . import bases
+from .bases import on_frame, off_frame
+
+
+__all__ = [
+    "UpdateQueue",
+    "enable",
+    "disable",
+    "queue",
+]
+
+
+class UpdateQueue:
+    """
+    Coalescing queue of updates made off the render thread.
+
+    Parameters:
+        render_thread: Ident of the thread that renders (and drains the queue).
+        Defaults to the thread creating the queue.
+    """
+
+    def __init__(self, render_thread: int = None):
+        self.render_thread = render_thread or threading.get_ident()
+        self.stats = {"queued": 0, "applied": 0}
+        self._pending = {}  # {(target, name): (apply, args)}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def defer(self, key: tuple, apply: Callable, *args: Any):
+        """Queues <apply(*args)> under <key>, replacing any update already 
+        queued for it, unless called from the render thread. Returns True 
+        if the update was queued."""
+        if threading.get_ident() == self.render_thread:
+            return False
+
+        with self._lock:
+            self._pending[key] = (apply, args)
+            self.stats["queued"] += 1
+
+        return True
+
+    def drain(self):
+        """Applies the queued updates. Needs to be called from the render 
+        thread. Returns the number of updates applied."""
+        if not self._pending:
+            return 0
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for apply, args in pending.values():
+            apply(*args)
+
+        self.stats["applied"] += len(pending)
+
+        return len(pending)
+
+
+def enable(render_thread: int = None):
+    """Starts marshaling updates made from other threads to the render 
+    thread (the calling thread by default). Returns the <UpdateQueue>,
+    which is drained every frame."""
+    if bases._marshal is None:
+        bases._marshal = UpdateQueue(render_thread)
+        on_frame(bases._marshal.drain)
+    elif render_thread:
+        bases._marshal.render_thread = render_thread
+
+    return bases._marshal
+
+
+def disable():
+    """Stops marshaling updates. Queued updates are applied first, so this
+    should be called from the render thread."""
+    if (update_queue := bases._marshal) is not None:
+        bases._marshal = None
+        off_frame(update_queue.drain)
+        update_queue.drain()
+
+
+def queue():
+    """Returns the active <UpdateQueue>, or None if marshaling is disabled."""
+    return bases._marshal
@@ -1,12 +1,18 @@
-from typing import Any
+import threading
+from typing import Any, Iterable
 
-from dearpygui import core as dpg
+from . import bases
+from .backend import core as dpg
 
 __all__ = [
     "ValueStorageProxy"
 ]
 
 
+_keys = set()  # generated or user-provided value storage keys in use
+_keys_lock = threading.Lock()
+
+
 class ValueStorageProxy:
     """Middle-man for DearPyGui's value storage system."""
     _keygen_counter = None
@@ -14,6 +20,9 @@ class ValueStorageProxy:
     _value = None
 
     def __init__(self, value: Any, key: str = None):
+        if key:
+            _keys.add(key)
+
         self._key = key or self._keygen()
         self._value = value
 
@@ -28,13 +37,47 @@ class ValueStorageProxy:
     @classmethod
     def _keygen(cls):
         """Generates an key for value storage."""
-        if cls._keygen_counter is None:
-            cls._keygen_counter = 0
+        return cls.reserve_keys(1)[0]
+
+    @classmethod
+    def reserve_keys(cls, n: int):
+        """Reserves <n> unique value storage keys, returning them in a list.
+        Keys are tracked Python-side instead of probing dearpygui, so values 
+        added directly through dearpygui should avoid the proxies' naming 
+        scheme ("ClassName<n>")."""
+        with _keys_lock:
+            counter = cls.__dict__.get("_keygen_counter") or 0
+
+            keys = []
+            while len(keys) < n:
+                # only keys passed in by the user can be skipped here
+                if (key := f'{cls.__name__}<{counter}>') not in _keys:
+                    keys.append(key)
+                counter += 1
+
+            cls._keygen_counter = counter
+            _keys.update(keys)
+
+        return keys
 
-        while dpg.get_value(key := f'{cls.__name__}<{cls._keygen_counter}>') is not None:
-            cls._keygen_counter += 1
+    @classmethod
+    def create_many(cls, values: Iterable[Any]):
+        """Creates a proxy for each value in <values>, returning them in a list.
+        Keys are reserved in one block and the values are added to dearpygui 
+        in a single pass, skipping per-proxy initialization."""
+        values = [*values]
+        add_value = dpg.add_value
+
+        proxies = []
+        for key, value in zip(cls.reserve_keys(len(values)), values):
+            add_value(key, value)
+
+            proxy = cls.__new__(cls)
+            proxy._key = key
+            proxy._value = value
+            proxies.append(proxy)
 
-        return key
+        return proxies
 
     @property
     def key(self):
@@ -47,10 +90,13 @@ class ValueStorageProxy:
 
     @value.setter
     def value(self, value):
-        dpg.set_value(self._key, value)
+        self.set(value)
 
     def get(self):
         return self.value
 
     def set(self, value):
+        if bases._marshal is not None and bases._marshal.defer((self, "value"), self.set, value):
+            return
+
         dpg.set_value(self._key, value)
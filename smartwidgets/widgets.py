@@ -1,6 +1,6 @@
 from typing import Union, Callable, Any
 
-from dearpygui import core as dpg
+from .backend import core as dpg
 
 from .bases import SmartObject, SmartDependant, ConfigProperty, AddOnlyMixin
 
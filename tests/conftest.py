@@ -0,0 +1,20 @@
+import os
+
+os.environ.setdefault("SMARTWIDGETS_BACKEND", "headless")
+
+import pytest
+
+from smartwidgets import bases
+from smartwidgets.backend import HeadlessBackend, set_backend
+
+
+@pytest.fixture(autouse=True)
+def backend():
+    """A fresh <HeadlessBackend> and Python-side state for each test."""
+    headless = HeadlessBackend(max_frames=3)
+    previous = set_backend(headless)
+    try:
+        yield headless
+    finally:
+        bases._reset()
+        set_backend(previous)
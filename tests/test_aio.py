@@ -0,0 +1,56 @@
+import asyncio
+
+from smartwidgets import Button, Window, aio, on_frame
+
+
+def test_frames_share_the_event_loop(backend):
+    frames, ticks = [], []
+    on_frame(lambda: frames.append(backend.frame_count))
+    window = Window().add()
+    window.end()
+
+    async def ticker():
+        while True:
+            ticks.append(backend.frame_count)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await window.start_async(frame_budget=0)
+        task.cancel()
+
+    asyncio.run(main())
+    assert frames == [0, 1, 2]
+    assert set(ticks) == {1, 2, 3}  # between every frame
+    assert not backend.running
+
+
+def test_coroutine_callbacks_are_scheduled_on_the_loop(backend):
+    calls = []
+    async def clicked(sender, data):
+        await asyncio.sleep(0)
+        calls.append((sender, data, backend.frame_count))
+
+    window = Window().add()
+    button = Button(callback=clicked).add()
+    window.end()
+    on_frame(lambda: backend.frame_count == 0 and backend.trigger(button.id, "data"))
+
+    asyncio.run(window.start_async(frame_budget=0))
+    (sender, data, frame), = calls
+    assert (sender, data) == (button.id, "data")
+    assert frame > 0  # didn't block the frame it was triggered in
+    assert not aio._tasks
+
+
+def test_coroutine_callbacks_run_without_a_loop(backend):
+    calls = []
+    async def clicked(sender, data):
+        calls.append(sender)
+
+    with Window():
+        button = Button().add()
+    button.callback = clicked
+
+    backend.trigger(button.id)
+    assert calls == [button.id]
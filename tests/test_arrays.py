@@ -0,0 +1,57 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from smartwidgets import DragFloat3, InputFloat, Window, dpg
+from smartwidgets.arrays import ArrayBinding
+
+
+@pytest.fixture
+def drags():
+    with Window():
+        return [DragFloat3().add() for _ in range(5)]
+
+
+def test_starts_from_current_values(drags):
+    dpg.set_value(drags[2].id, [1.0, 2.0, 3.0])
+
+    binding = ArrayBinding([item.id for item in drags])
+    assert binding.array.shape == (5, 3)
+    assert binding.array[2].tolist() == [1.0, 2.0, 3.0]
+    assert binding.push() == 0
+    assert dpg.get_value(drags[2].id) == [1.0, 2.0, 3.0]
+
+
+def test_push_sends_changed_rows_only(drags):
+    binding = ArrayBinding(drags)
+    binding.array[[1, 3]] += 1
+
+    assert binding.changed().tolist() == [1, 3]
+    assert binding.push() == 2
+    assert binding.push() == 0
+    assert dpg.get_value(drags[3].id) == [1.0, 1.0, 1.0]
+
+
+def test_pull_reads_every_value(drags):
+    array = np.zeros((5, 3))
+    binding = ArrayBinding(drags, array)
+    dpg.set_value(drags[4].id, [4.0, 5.0, 6.0])
+
+    assert binding.pull() is array
+    assert array[4].tolist() == [4.0, 5.0, 6.0]
+    assert binding.push() == 0
+
+
+def test_scalar_items():
+    with Window():
+        items = [InputFloat().add() for _ in range(3)]
+
+    binding = ArrayBinding(items)
+    binding.array[0] = 2.5
+    assert binding.push() == 1
+    assert dpg.get_value(items[0].id) == 2.5
+
+
+def test_rows_must_match_items(drags):
+    with pytest.raises(ValueError):
+        ArrayBinding(drags, np.zeros((2, 3)))
@@ -0,0 +1,41 @@
+import pytest
+
+from smartwidgets import Button, Window, dpg, get_backend, set_backend
+from smartwidgets.backend import HeadlessBackend
+
+
+def test_calls_go_through_the_current_backend(backend):
+    with Window() as window:
+        button = Button(label="ok").add()
+
+    assert backend.get_item_parent(button.id) == window.id
+    assert backend.get_item_configuration(button.id)["label"] == "ok"
+
+    other = HeadlessBackend()
+    previous = set_backend(other)
+    try:
+        assert get_backend() is other
+        assert not dpg.does_item_exist(button.id)
+    finally:
+        set_backend(previous)
+
+
+def test_headless_models_the_container_stack():
+    dpg.add_window("window")
+    dpg.add_group("group")
+    dpg.add_text("text")
+    dpg.end()
+    dpg.end()
+
+    assert dpg.get_item_parent("text") == "group"
+    assert dpg.get_item_children("window") == ["group"]
+    with pytest.raises(Exception):
+        dpg.add_text("text")
+
+
+def test_constants_are_read_from_the_backend(backend):
+    with pytest.raises(AttributeError):
+        dpg.mvMouseButton_Right
+
+    backend.mvMouseButton_Right = 1
+    assert dpg.mvMouseButton_Right == 1
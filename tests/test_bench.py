@@ -0,0 +1,13 @@
+from smartwidgets import bases, bench
+
+
+def test_run_reports_and_resets_state():
+    results = bench.run(20, only=["construction", "delete", "reorder"])
+
+    names = {result["name"] for result in results["results"]}
+    assert names == {"construction", "delete", "reorder"}
+    assert all(result["calls"] >= 0 and result["wall_time"] >= 0 for result in results["results"])
+
+    assert len(bases._smartitems) == 0
+    assert not bases._reserved_ids
+    assert not bases._children and not bases._frame_callbacks
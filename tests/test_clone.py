@@ -0,0 +1,41 @@
+from smartwidgets import Button, Group, Window, deferred, dpg, smartitem, verify_tree
+
+
+def test_clone_copies_the_subtree():
+    with Window() as window:
+        with Group(horizontal=True) as group:
+            Button(label="ok", width=40).add()
+            Button(width=60).add()
+
+    copies = group.clone(2)
+    assert window.children() == [group.id, *(copy.id for copy in copies)]
+    for copy in copies:
+        assert isinstance(copy, Group) and copy.horizontal
+        ok, other = (smartitem(id) for id in copy.children())
+        assert (ok.label, ok.width, other.width) == ("ok", 40, 60)
+        assert other.label == other.id  # not copied from the original
+        assert dpg.get_item_parent(ok.id) == copy.id
+    assert verify_tree() == {}
+
+
+def test_clone_uses_the_live_configuration():
+    with Window():
+        button = Button(width=40).add()
+    dpg.configure_item(button.id, width=80)
+
+    copy, = button.clone()
+    assert copy.width == 80
+
+
+def test_clone_deferred_items_into_a_parent():
+    with Window() as window:
+        pass
+    with deferred():
+        with Group() as group:
+            Button(label="deferred").add()
+
+    copy, = group.clone(parent=window)
+    button_id, = copy.children()
+    assert smartitem(button_id).label == "deferred"
+    assert window.children() == [copy.id]
+    assert not group.is_valid
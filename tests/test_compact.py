@@ -0,0 +1,35 @@
+from smartwidgets import Button, Window, bench, compact, dpg
+
+
+def test_compact_classes_are_created_once():
+    CompactButton = compact(Button)
+    assert compact(Button) is CompactButton
+    assert compact(CompactButton) is CompactButton
+    assert issubclass(CompactButton, Button)
+    assert CompactButton.__name__ == "Button"
+
+
+def test_compact_instances_store_options_in_slots():
+    CompactButton = compact(Button)
+    button = CompactButton(label="ok", width=100)
+
+    assert CompactButton.options() == Button.options()
+    assert "width" not in button.__dict__
+    assert button.configuration() == Button(label="ok", width=100).configuration()
+
+
+def test_compact_instances_update_dearpygui():
+    with Window():
+        button = compact(Button)(width=100).add()
+
+    button.width = 50
+    assert dpg.get_item_configuration(button.id)["width"] == 50
+
+    dpg.configure_item(button.id, width=20)
+    assert button.width == 20
+    assert button.configuration()["width"] == 20
+
+
+def test_memory_compares_layouts():
+    result = bench.memory(Button, 100)
+    assert result["compact"] < result["dict"]
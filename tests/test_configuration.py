@@ -0,0 +1,45 @@
+from smartwidgets import Button, Window, dpg, snapshot, write_back
+
+
+def _count_calls(backend, monkeypatch, name):
+    calls = []
+    func = getattr(backend, name)
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return func(*args, **kwargs)
+    monkeypatch.setattr(backend, name, counted)
+    return calls
+
+
+def test_configuration_fetches_once(backend, monkeypatch):
+    with Window():
+        button = Button(label="ok", width=100).add()
+    dpg.configure_item(button.id, width=50)  # changed outside of smartwidgets
+
+    calls = _count_calls(backend, monkeypatch, "get_item_configuration")
+    config = button.configuration()
+    assert len(calls) == 1
+    assert (config["label"], config["width"]) == ("ok", 50)
+    assert button.configuration("width", "label") == {"width": 50, "label": "ok"}
+
+
+def test_configuration_of_unrealized_items(backend, monkeypatch):
+    calls = _count_calls(backend, monkeypatch, "get_item_configuration")
+    button = Button(width=100)
+
+    assert button.configuration()["width"] == 100
+    assert button.configuration("width") == {"width": 100}
+    assert calls == []
+
+
+def test_snapshot_includes_pending_writes():
+    with Window():
+        first, second = Button(width=100).add(), Button(width=100).add()
+
+    with write_back():
+        first.width = 10
+        snapshots = snapshot(first, second.id)
+        assert dpg.get_item_configuration(first.id)["width"] == 100
+
+    assert snapshots[first.id]["width"] == 10
+    assert snapshots[second.id]["width"] == 100
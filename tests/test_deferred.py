@@ -0,0 +1,66 @@
+import time
+import threading
+
+import pytest
+
+from smartwidgets import Button, Group, ValueStorageProxy, Window, bases, deferred, dpg, realize, vss
+
+
+def test_nothing_is_added_until_realized(backend):
+    window = Window().add()
+    window.end()
+
+    with deferred() as roots:
+        with Group(parent=window) as group:
+            buttons = [Button().add() for _ in range(3)]
+
+    assert roots == [group]
+    assert not dpg.does_item_exist(group.id)
+    assert not group.is_valid
+
+    assert realize(group) == [group]
+    assert dpg.get_item_children(group.id) == [button.id for button in buttons]
+    assert all(button.is_valid for button in buttons)
+    assert window.children() == [group.id]
+
+
+class _YieldingSet(set):
+    # gives other threads a chance to run in the middle of reserving ids
+    def __contains__(self, value):
+        found = super().__contains__(value)
+        time.sleep(0.0001)
+        return found
+
+
+@pytest.fixture
+def contended(monkeypatch):
+    monkeypatch.setattr(bases, "_reserved_ids", _YieldingSet())
+    monkeypatch.setattr(vss, "_keys", _YieldingSet())
+
+
+def _in_threads(func, n=4):
+    threads = [threading.Thread(target=func) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_construction_gets_distinct_ids(contended):
+    bases.set_weak_registry(False)
+    built = []
+    def build():
+        with deferred():
+            built.extend(Button() for _ in range(250))
+
+    _in_threads(build)
+    ids = [button.id for button in built]
+    assert len(ids) == len(set(ids)) == 1000
+    assert all(bases._smartitems[id] is button for id, button in zip(ids, built))
+
+
+def test_concurrent_value_keys_are_distinct(contended):
+    keys = []
+    _in_threads(lambda: keys.extend(ValueStorageProxy.reserve_keys(1)[0] for _ in range(250)))
+
+    assert len(keys) == len(set(keys)) == 1000
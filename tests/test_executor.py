@@ -0,0 +1,94 @@
+from concurrent.futures import Executor, Future
+
+from smartwidgets import Button, Window
+from smartwidgets.executor import deliver, in_executor
+
+
+class ManualExecutor(Executor):
+    """Runs submitted calls when <start> and <finish> are called."""
+
+    def __init__(self):
+        self.calls = []  # [Future, func, args]
+
+    def submit(self, func, *args):
+        future = Future()
+        self.calls.append((future, func, args))
+        return future
+
+    def start(self, index=0):
+        future, _, _ = self.calls[index]
+        assert future.set_running_or_notify_cancel()
+
+    def finish(self, index=0):
+        future, func, args = self.calls[index]
+        if not future.running():
+            self.start(index)
+        future.set_result(func(*args))
+
+
+def _button(callback):
+    with Window():
+        return Button(callback=callback).add()
+
+
+def test_sender_is_busy_while_calls_are_in_flight(backend):
+    executor, results = ManualExecutor(), []
+    callback = in_executor(lambda sender, data: data * 2, executor=executor,
+        on_result=lambda sender, result: results.append(result))
+    button = _button(callback)
+
+    backend.trigger(button.id, 21)
+    assert not button.enabled
+    assert callback.in_flight == 1
+
+    executor.finish()
+    assert results == []  # only handed back on the render thread
+    assert deliver() == 1
+    assert results == [42]
+    assert button.enabled and callback.in_flight == 0
+
+
+def test_new_calls_supersede_older_ones(backend):
+    executor, results = ManualExecutor(), []
+    callback = in_executor(lambda sender, data: data, executor=executor,
+        on_result=lambda sender, result: results.append(result))
+    button = _button(callback)
+
+    backend.trigger(button.id, "running")
+    executor.start(0)
+    backend.trigger(button.id, "waiting")
+    backend.trigger(button.id, "latest")
+    assert len(executor.calls) == 1 and callback.in_flight == 2
+
+    executor.finish(0)
+    deliver()
+    assert results == []  # superseded
+    assert not button.enabled
+
+    executor.finish(1)
+    deliver()
+    assert executor.calls[1][2] == (button.id, "latest")
+    assert results == ["latest"]
+    assert button.enabled and callback.in_flight == 0
+
+
+def test_errors_are_handed_back(backend):
+    errors = []
+    def fail(sender, data):
+        raise ValueError(data)
+
+    executor = ManualExecutor()
+    button = _button(in_executor(fail, executor=executor,
+        on_error=lambda sender, exc: errors.append(exc)))
+
+    backend.trigger(button.id, "data")
+    future, func, args = executor.calls[0]
+    future.set_running_or_notify_cancel()
+    try:
+        func(*args)
+    except ValueError as exc:
+        future.set_exception(exc)
+
+    deliver()
+    error, = errors
+    assert isinstance(error, ValueError) and button.enabled
@@ -0,0 +1,31 @@
+from smartwidgets import Button, Window, bases, reserve_ids
+
+
+def _counted():
+    # counters are kept per class, so each test starts from a new one
+    class Counted(Button):
+        pass
+    return Counted
+
+
+def test_generated_ids_count_up_per_class():
+    Counted = _counted()
+    assert reserve_ids(Counted, 3) == ["Counted<0>", "Counted<1>", "Counted<2>"]
+    assert Counted().id == "Counted<3>"
+    assert Counted._generator_id == 4
+
+
+def test_user_ids_are_skipped():
+    Counted = _counted()
+    taken = Counted(id="Counted<1>")
+    assert [Counted().id for _ in range(3)] == ["Counted<0>", "Counted<2>", "Counted<3>"]
+    assert taken.id in bases._reserved_ids
+
+
+def test_ids_are_released_on_delete():
+    with Window():
+        button = Button().add()
+    assert button.id in bases._reserved_ids
+
+    button.delete()
+    assert button.id not in bases._reserved_ids
@@ -0,0 +1,64 @@
+import ast
+import inspect
+import os
+
+import pytest
+
+from smartwidgets import Window, compact, dpg
+from smartwidgets.inputs import drag, input, slider
+
+
+def _stub_signatures(module):
+    # {"class name": [(parameter, default), ...]} from the modules' .pyi file
+    with open(os.path.splitext(module.__file__)[0] + ".pyi") as file:
+        tree = ast.parse(file.read())
+
+    signatures = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+            init, = (item for item in node.body if getattr(item, "name", None) == "__init__")
+            args = init.args
+            signatures[node.name] = [
+                (arg.arg, ast.literal_eval(default))
+                for arg, default in zip(args.kwonlyargs, args.kw_defaults)
+            ]
+
+    return signatures
+
+
+@pytest.mark.parametrize("module", [input, drag, slider])
+def test_signatures_match_the_stubs(module):
+    stubs = _stub_signatures(module)
+    for name, *_ in module._CLASSES:
+        params = inspect.signature(getattr(module, name)).parameters
+        assert [*params][0] == "id"
+        assert [
+            (param.name, param.default) for param in params.values()
+            if param.kind is param.KEYWORD_ONLY
+        ] == stubs[name], name
+
+
+def test_generated_classes_add_their_options():
+    with Window():
+        item = input.InputFloat4(width=50, callback_data="data", readonly=True).add()
+        integer = input.InputInt(step=5).add()
+
+    config = dpg.get_item_configuration(item.id)
+    assert (config["width"], config["readonly"]) == (50, True)
+    assert dpg.get_item_callback_data(item.id) == "data"
+    assert config["format"] == "%.3f"
+    assert dpg.get_value(item.id) == [0.0] * 4
+    assert dpg.get_item_configuration(integer.id)["step"] == 5
+    assert item.configuration("width", "readonly") == {"width": 50, "readonly": True}
+
+
+def test_generated_classes_go_through_descriptors_when_needed():
+    async def changed(sender, data):
+        pass
+
+    item = slider.SliderFloat3(callback=changed)
+    assert item.callback is not changed and item.callback.__wrapped__ is changed
+
+    item = compact(drag.DragInt)(width=20, speed=2)
+    assert "width" not in vars(item)
+    assert (item.width, item.speed) == (20, 2)
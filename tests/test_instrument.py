@@ -0,0 +1,33 @@
+from smartwidgets import Button, Window, get_backend, instrument, run_frame
+
+
+def test_calls_are_attributed(backend):
+    with Window():
+        button = Button().add()
+
+    with instrument.instrumented() as stats:
+        button.width = 10
+        assert instrument.stats() is stats
+
+    assert get_backend() is backend
+    assert stats.calls["configure_item"][0] == 1
+    assert stats.classes == {"Button": stats.calls["configure_item"]}
+    assert stats.items == {button.id: stats.calls["configure_item"]}
+    assert stats.properties == {"width": stats.calls["configure_item"]}
+    assert [site for site in stats.sites if site.startswith(__file__)]
+
+
+def test_per_frame_stats():
+    frames = []
+    with Window():
+        button = Button().add()
+
+    with instrument.instrumented(frames.append):
+        button.width
+        run_frame()
+        run_frame()
+
+    first, second = frames
+    assert first.calls["get_item_configuration"][0] == 1
+    assert "get_item_configuration" not in second.calls
+    assert instrument.stats() is None
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from smartwidgets import Button, Group, Text, Window, dpg, layout, smartitem, verify_tree
+
+
+SPEC = {
+    "type": "Window",
+    "label": "Main",
+    "children": [
+        {"type": "Group", "horizontal": True, "children": [
+            {"type": "Text", "default_value": "Name"},
+            {"type": "Button", "label": "ok"},
+        ]},
+        {"type": "Text", "default_value": "Footer"},
+    ],
+}
+
+
+def test_plans_are_compiled_once(tmp_path):
+    plan = layout.compile_spec(SPEC)
+    assert len(plan) == 5
+    assert layout.compile_spec(json.loads(json.dumps(SPEC))) is plan
+    assert layout.compile_spec(json.dumps(SPEC)) is plan
+
+    path = tmp_path / "layout.json"
+    path.write_text(json.dumps(SPEC))
+    assert layout.compile_spec(str(path)) is plan
+
+
+def test_build_adds_the_tree():
+    window, = layout.build(SPEC)
+    assert isinstance(window, Window) and window.label == "Main"
+
+    group_id, footer_id = window.children()
+    group, footer = smartitem(group_id), smartitem(footer_id)
+    assert isinstance(group, Group) and group.horizontal
+    assert dpg.get_value(footer.id) == "Footer"
+
+    name, button = (smartitem(id) for id in group.children())
+    assert isinstance(name, Text) and dpg.get_value(name.id) == "Name"
+    assert isinstance(button, Button) and button.label == "ok"
+    assert dpg.get_item_parent(button.id) == group.id
+    assert verify_tree() == {}
+
+
+def test_realize_copies_and_unbound():
+    with Window() as window:
+        pass
+    plan = layout.compile_spec([{"type": "Button"}, {"type": "Text"}])
+
+    first, second = plan.realize(window)
+    assert isinstance(first, Button) and second.parent == window.id
+    ids = plan.realize(window, bind=False, copies=2)
+    assert all(isinstance(id, str) and smartitem(id) is None for id in ids)
+    assert window.children() == [first.id, second.id, *ids]
+    assert len(set(window.children())) == 6
+
+
+def test_invalid_specs():
+    with pytest.raises(ValueError):
+        layout.compile_spec({"type": "NotAnItem"})
+    with pytest.raises(ValueError):
+        layout.compile_spec({"type": "Button", "children": [{"type": "Text"}]})
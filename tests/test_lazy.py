@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import smartwidgets
+
+
+def _run(code):
+    # in a new interpreter, since the submodules are already imported here
+    root = os.path.dirname(os.path.dirname(os.path.abspath(smartwidgets.__file__)))
+    env = {**os.environ, "PYTHONPATH": root, "SMARTWIDGETS_BACKEND": "headless"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def test_submodules_are_imported_on_first_use():
+    loaded = _run(
+        "import sys, smartwidgets\n"
+        "print(*(name in sys.modules for name in ("
+        "'smartwidgets.containers', 'smartwidgets.inputs', 'dearpygui', 'numpy')))\n"
+        "smartwidgets.Window\n"
+        "print(*(name in sys.modules for name in ("
+        "'smartwidgets.containers', 'smartwidgets.inputs')))\n"
+    )
+    assert loaded == ["False"] * 4 + ["True", "False"]
+
+
+def test_every_public_name_resolves():
+    for name in smartwidgets.__all__:
+        assert getattr(smartwidgets, name) is not None
+
+    assert smartwidgets.Window is smartwidgets.containers.Window
+    assert set(smartwidgets.__all__) <= set(dir(smartwidgets))
+    assert "containers" in dir(smartwidgets)
+    with pytest.raises(AttributeError):
+        smartwidgets.NotAName
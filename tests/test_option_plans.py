@@ -0,0 +1,31 @@
+from smartwidgets import Button, ConfigProperty, Text, Window, compact
+
+
+def test_plans_sort_options_by_how_they_are_read():
+    plan = Text._plan
+    assert plan.options == Text.options()
+    assert set(plan.plain) | set(plan.special) | set(plan.addl) == set(plan.options)
+    assert {"parent", "before"} <= set(plan.addl)
+    assert "wrap" in plan.plain
+    assert {"callback", "callback_data"} <= set(Button._plan.special)
+    assert plan.in_dict and not compact(Text)._plan.in_dict
+
+
+def test_subclasses_get_their_own_plan():
+    class Bordered(Button):
+        border = ConfigProperty()
+
+    assert Bordered._plan is not Button._plan
+    assert set(Bordered.options()) == {*Button.options(), "border"}
+    assert "border" in Bordered._plan.plain
+    assert "border" not in Button.options()
+
+
+def test_configuration_matches_the_options():
+    for cls in (Button, compact(Button)):
+        button = cls(label="ok", width=30)
+        assert button.configuration() == {opt: getattr(button, opt) for opt in cls.options()}
+
+        with Window():
+            button.add()
+        assert button.configuration() == {opt: getattr(button, opt) for opt in cls.options()}
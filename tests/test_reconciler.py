@@ -0,0 +1,102 @@
+from smartwidgets import Button, InputFloat, InputText, Text, Window, dpg, verify_tree
+from smartwidgets.reconciler import reconcile
+
+
+def _rows(names):
+    return [{"type": Text, "key": name, "default_value": name} for name in names]
+
+
+def test_keyed_items_are_kept_and_reordered(backend, monkeypatch):
+    window = Window().add()
+    window.end()
+    first = reconcile(window, _rows(["a", "b", "c", "d"]))
+
+    calls = {"add_text": 0, "move_item": 0}
+    for name in calls:
+        func = getattr(backend, name)
+        def counted(*args, _name=name, _func=func, **kwargs):
+            calls[_name] += 1
+            return _func(*args, **kwargs)
+        monkeypatch.setattr(backend, name, counted)
+
+    second = reconcile(window, _rows(["d", "a", "b", "c"]))
+    assert [item.id for item in second] == [first[3].id, *(item.id for item in first[:3])]
+    assert window.children() == [item.id for item in second]
+    assert calls == {"add_text": 0, "move_item": 1}
+    assert verify_tree() == {}
+
+
+def test_unmatched_items_are_deleted_and_new_ones_added():
+    window = Window().add()
+    window.end()
+    first = reconcile(window, _rows(["a", "b"]))
+
+    second = reconcile(window, _rows(["b", "c"]))
+    assert second[0] is first[1]
+    assert not dpg.does_item_exist(first[0].id)
+    assert dpg.get_value(second[1].id) == "c"
+    assert window.children() == [item.id for item in second]
+
+
+def test_only_changed_options_are_sent(backend, monkeypatch):
+    window = Window().add()
+    window.end()
+    button, = reconcile(window, {"type": Button, "label": "a", "width": 10})
+
+    sent = []
+    configure_item = backend.configure_item
+    def counted(item, **config):
+        sent.append(config)
+        return configure_item(item, **config)
+    monkeypatch.setattr(backend, "configure_item", counted)
+
+    again, = reconcile(window, {"type": Button, "label": "b", "width": 10})
+    assert again is button
+    assert sent == [{"label": "b"}]
+
+
+def test_changed_keyed_values_are_set():
+    window = Window().add()
+    window.end()
+    text, field = reconcile(window, [
+        {"type": Text, "key": "a", "default_value": "a"},
+        {"type": InputFloat, "key": "b", "default_value": 1.0},
+    ])
+
+    again = reconcile(window, [
+        {"type": Text, "key": "a", "default_value": "z"},
+        {"type": InputFloat, "key": "b", "default_value": 2.0},
+    ])
+    assert again == [text, field]
+    assert dpg.get_value(text.id) == "z"
+    assert (dpg.get_value(field.id), field.default_value) == (2.0, 2.0)
+
+
+def test_options_are_compared_to_the_live_configuration():
+    window = Window().add()
+    window.end()
+    spec = [
+        {"type": Button, "key": "a", "width": 10},
+        {"type": InputFloat, "key": "b", "default_value": 1.0},
+    ]
+    button, field = reconcile(window, spec)
+
+    # changed by the user (or dearpygui) since
+    dpg.configure_item(button.id, width=50)
+    dpg.set_value(field.id, 5.0)
+
+    assert reconcile(window, spec) == [button, field]
+    assert dpg.get_item_configuration(button.id)["width"] == 10
+    assert dpg.get_value(field.id) == 1.0
+
+
+def test_options_fixed_at_creation_recreate_the_item():
+    window = Window().add()
+    window.end()
+    field, = reconcile(window, {"type": InputText, "key": "a", "multiline": False})
+
+    again, = reconcile(window, {"type": InputText, "key": "a", "multiline": True})
+    assert again is not field
+    assert again.multiline
+    assert not dpg.does_item_exist(field.id)
+    assert window.children() == [again.id]
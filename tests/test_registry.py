@@ -0,0 +1,63 @@
+import gc
+
+import pytest
+
+from smartwidgets import Button, Window, bases, registry_report, set_weak_registry, smartitem
+
+
+def test_unrealized_items_are_held_weakly():
+    button = Button()
+    id = button.id
+    assert smartitem(id) is button
+
+    del button
+    gc.collect()
+    assert smartitem(id) is None
+    assert id not in bases._reserved_ids
+
+
+def test_realized_items_are_held_until_deleted():
+    with Window():
+        id = Button().add().id
+    gc.collect()
+    assert smartitem(id) is not None
+
+    smartitem(id).delete()
+    assert smartitem(id) is None
+
+
+def test_iteration_skips_collected_items():
+    def cycle():
+        button = Button()
+        button.callback = button.delete  # only collected by the cycle collector
+
+    gc.disable()
+    try:
+        for _ in range(10):
+            cycle()
+        ids = [*bases._smartitems]
+        assert len(ids) == 10
+
+        gc.collect()
+        assert registry_report()["items"] == 0
+        assert bases._smartitems.items() == []
+        assert all(bases._smartitems.get(id) is None for id in ids)
+    finally:
+        gc.enable()
+
+
+def test_clear_and_popitem():
+    set_weak_registry(False)
+    try:
+        buttons = [Button() for _ in range(3)]
+        id, item = bases._smartitems.popitem()
+        assert item in buttons and not bases._smartitems.is_pinned(id)
+
+        bases._smartitems.clear()
+        assert len(bases._smartitems) == 0
+        assert not bases._smartitems.is_pinned(buttons[0].id)
+        assert not {button.id for button in buttons if button is not item} & bases._reserved_ids
+        with pytest.raises(KeyError):
+            bases._smartitems.popitem()
+    finally:
+        set_weak_registry(True)
@@ -0,0 +1,38 @@
+from smartwidgets import Button, ItemState, Window, dpg, smartitem, sync_states
+
+
+def test_lifecycle():
+    button = Button()
+    assert button.state is ItemState.CONSTRUCTED and not button.is_valid
+
+    with Window():
+        button.add()
+    assert button.state is ItemState.REALIZED and button.is_valid
+
+    button.delete()
+    assert button.state is ItemState.DELETED and not button.is_valid
+
+
+def test_is_valid_does_not_probe_dearpygui(backend, monkeypatch):
+    with Window():
+        button = Button().add()
+
+    def probe(item):
+        raise AssertionError(item)
+    monkeypatch.setattr(backend, "does_item_exist", probe)
+    assert button.is_valid
+    button.width = 10
+    assert button.width == 10
+
+
+def test_sync_states_finds_items_deleted_through_dearpygui():
+    with Window() as window:
+        deleted, kept = Button().add(), Button().add()
+    dpg.delete_item(deleted.id)
+
+    assert deleted.is_valid  # not known until synced
+    assert sync_states() == [deleted.id]
+    assert deleted.state is ItemState.DELETED
+    assert smartitem(deleted.id) is None
+    assert window.children() == [kept.id]
+    assert sync_states() == []
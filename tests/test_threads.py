@@ -0,0 +1,47 @@
+import threading
+
+from smartwidgets import Button, Group, Window, deferred, realize, smartitem, threads
+
+
+def _in_thread(func):
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+def test_deferred_build_in_worker_thread():
+    window = Window().add()
+    window.end()
+    update_queue = threads.enable()
+
+    roots = []
+    def build():
+        with deferred():
+            with Group(parent=window) as group:
+                Button(label="ok").add()
+        roots.append(group)
+
+    _in_thread(build)
+    assert len(update_queue) == 0
+
+    group, = realize(*roots)
+    assert window.children() == [group.id]
+    button = smartitem(group.children()[0])
+    assert button.is_valid
+    assert button.label == "ok"
+    assert update_queue.stats["queued"] == 0
+
+
+def test_writes_to_realized_items_are_queued():
+    window = Window().add()
+    button = Button(parent=window, width=10).add()
+    window.end()
+    update_queue = threads.enable()
+
+    _in_thread(lambda: setattr(button, "width", 20))
+    _in_thread(lambda: setattr(button, "width", 30))
+    assert len(update_queue) == 1
+    assert button.width == 10
+
+    assert update_queue.drain() == 1
+    assert button.width == 30
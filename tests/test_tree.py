@@ -0,0 +1,109 @@
+import pytest
+
+from smartwidgets import Button, Group, Text, Window, delete_many, dpg, smartitem, verify_tree
+
+
+def test_delete_many():
+    with Window() as window:
+        with Group() as group:
+            nested = Button().add()
+        sibling = Button().add()
+
+    delete_many([group, sibling, nested])
+    assert window.children() == []
+    assert not any(dpg.does_item_exist(item.id) for item in (group, sibling, nested))
+    assert smartitem(nested.id) is None
+    assert verify_tree() == {}
+
+
+def test_deep_trees_are_deleted_with_one_call(backend, monkeypatch):
+    window = Window().add()
+    parent = window
+    for _ in range(2000):  # deeper than the recursion limit
+        parent = Group(parent=parent).add()
+    window.end()
+
+    calls = []
+    delete_item = backend.delete_item
+    def counted(item, **kwargs):
+        calls.append(item)
+        return delete_item(item, **kwargs)
+    monkeypatch.setattr(backend, "delete_item", counted)
+
+    window.delete()
+    assert calls == [window.id]
+    assert smartitem(parent.id) is None
+    assert parent.state.name == "DELETED"
+
+
+def test_raw_container_mixed_with_items():
+    with Window() as window:
+        text = Text("a").add()
+        dpg.add_group("raw_group")
+        dpg.add_text("raw_text")
+        inner = Button().add()
+        dpg.end()
+        outer = Button().add()
+
+    assert inner.parent == dpg.get_item_parent(inner.id) == "raw_group"
+    assert outer.parent == window.id
+    assert window.children() == dpg.get_item_children(window.id)
+    assert window.children() == [text.id, "raw_group", outer.id]
+    assert verify_tree() == {}
+
+    window.delete()
+    assert not dpg.does_item_exist(inner.id)
+    assert verify_tree() == {}
+
+
+def test_children_and_before_follow_moves():
+    with Window() as window:
+        a, b, c = Button().add(), Button().add(), Button().add()
+
+    assert a.before == b.id
+    c.move(window, a)
+    assert window.children() == [c.id, a.id, b.id]
+    b.move_up()
+    assert window.children() == [c.id, b.id, a.id]
+    assert verify_tree() == {}
+
+
+def test_verify_tree_reports_and_fixes_drift():
+    with Window() as window:
+        button = Button().add()
+    dpg.add_text("added_directly", parent=window.id)
+
+    drift = verify_tree()
+    assert drift == {window.id: ([button.id], [button.id, "added_directly"])}
+    assert verify_tree(fix=True) == drift
+    assert window.children() == [button.id, "added_directly"]
+    assert verify_tree() == {}
+
+
+def test_reorder_moves_only_what_is_out_of_place(backend, monkeypatch):
+    with Window():
+        with Group() as group:
+            buttons = [Button().add() for _ in range(10)]
+
+    moves = []
+    move_item = backend.move_item
+    def counted(item, **kwargs):
+        moves.append(item)
+        return move_item(item, **kwargs)
+    monkeypatch.setattr(backend, "move_item", counted)
+
+    order = [buttons[-1], *buttons[:-1]]
+    group.reorder(order)
+    assert group.children() == [button.id for button in order]
+    assert dpg.get_item_children(group.id) == group.children()
+    assert len(moves) == 1
+    assert verify_tree() == {}
+
+
+def test_reorder_needs_every_child():
+    with Window():
+        with Group() as group:
+            first, _ = Button().add(), Button().add()
+
+    with pytest.raises(ValueError):
+        group.reorder([first])
@@ -0,0 +1,62 @@
+from smartwidgets import VirtualList, Window, dpg, run_frame
+from smartwidgets.bases import _frame_callbacks
+
+
+def _list(count, rendered):
+    with Window():
+        listing = VirtualList(
+            lambda row, index: rendered.append(index) or dpg.set_value(row.id, str(index)),
+            count=count, height=100, row_height=20,
+        ).add()
+    run_frame()
+    return listing
+
+
+def test_only_visible_rows_are_kept():
+    rendered = []
+    listing = _list(1000, rendered)
+
+    assert len(listing.rows) == 7  # 100 // 20 + 1, and one overscan row
+    assert rendered == [*range(7)]
+    top, *rows, bottom = listing.children()
+    assert rows == [row.id for row in listing.rows]
+    assert dpg.get_item_configuration(bottom)["height"] == (1000 - 7) * 20
+
+    rendered.clear()
+    run_frame()
+    assert rendered == []  # nothing scrolled
+
+
+def test_scroll_to_rebinds_the_rows():
+    rendered = []
+    listing = _list(1000, rendered)
+    rendered.clear()
+
+    listing.scroll_to(500)
+    assert listing.first == 500
+    assert rendered == [*range(500, 507)]
+    assert dpg.get_value(listing.rows[0].id) == "500"
+    top, *_, bottom = listing.children()
+    assert dpg.get_item_configuration(top)["height"] == 500 * 20
+    assert len(listing.rows) == 7
+
+
+def test_count_changes_hide_unused_rows():
+    rendered = []
+    listing = _list(1000, rendered)
+
+    listing.count = 3
+    run_frame()
+    assert [row.show for row in listing.rows] == [True] * 3 + [False] * 4
+
+    listing.count = 1000
+    run_frame()
+    assert all(row.show for row in listing.rows)
+
+
+def test_delete_stops_updates():
+    listing = _list(10, [])
+    assert listing.update in _frame_callbacks
+
+    listing.delete()
+    assert listing.update not in _frame_callbacks
@@ -0,0 +1,33 @@
+from smartwidgets import ValueStorageProxy, dpg, vss
+
+
+def test_proxies_get_distinct_keys():
+    counter = ValueStorageProxy.__dict__.get("_keygen_counter") or 0
+    first, second = ValueStorageProxy(1), ValueStorageProxy(2)
+    assert first.key != second.key
+    assert (first.value, second.value) == (1, 2)
+
+    many = ValueStorageProxy.create_many(range(5))
+    keys = [first.key, second.key, *(proxy.key for proxy in many)]
+    assert len(set(keys)) == 7
+    assert ValueStorageProxy._keygen_counter == counter + 7
+    assert [dpg.get_value(proxy.key) for proxy in many] == [*range(5)]
+
+
+def test_user_keys_are_skipped():
+    counter = ValueStorageProxy.__dict__.get("_keygen_counter") or 0
+    taken = ValueStorageProxy("taken", key=f"ValueStorageProxy<{counter}>")
+
+    proxy = ValueStorageProxy("generated")
+    assert proxy.key == f"ValueStorageProxy<{counter + 1}>"
+    assert dpg.get_value(taken.key) == "taken"
+    assert {taken.key, proxy.key} <= vss._keys
+
+
+def test_set_and_get_go_through_value_storage():
+    proxy = ValueStorageProxy(1)
+    proxy.value = 2
+    assert dpg.get_value(proxy.key) == 2
+
+    dpg.set_value(proxy.key, 3)
+    assert proxy.get() == 3
@@ -0,0 +1,106 @@
+import pytest
+
+from smartwidgets import (
+    Button,
+    Window,
+    dpg,
+    flush,
+    on_frame,
+    run_frame,
+    set_write_back,
+    write_back,
+    write_back_stats,
+)
+
+
+def _buttons(n):
+    with Window():
+        return [Button(width=100).add() for _ in range(n)]
+
+
+def test_writes_are_batched_per_item(backend, monkeypatch):
+    button, = _buttons(1)
+    calls = []
+    configure_item = backend.configure_item
+    def counted(item, **config):
+        calls.append(config)
+        return configure_item(item, **config)
+    monkeypatch.setattr(backend, "configure_item", counted)
+
+    with write_back():
+        button.width = 10
+        button.width = 20
+        button.height = 30
+        assert button.width == 20  # pending values are read back
+        assert calls == []
+
+    assert calls == [{"width": 20, "height": 30}]
+    assert dpg.get_item_configuration(button.id)["width"] == 20
+
+
+def test_flush_skips_items_deleted_through_dearpygui():
+    deleted, kept = _buttons(2)
+    set_write_back(True)
+    deleted.width = 10
+    kept.width = 20
+    dpg.delete_item(deleted.id)
+
+    assert flush() == 1
+    assert dpg.get_item_configuration(kept.id)["width"] == 20
+
+    stats = write_back_stats()
+    assert (stats["calls"], stats["dropped"], stats["coalesced"]) == (1, 1, 0)
+
+
+def test_flush_sends_every_update_before_raising(backend, monkeypatch):
+    broken, kept = _buttons(2)
+    configure_item = backend.configure_item
+    def configure(item, **config):
+        if item == broken.id:
+            raise ValueError(item)
+        return configure_item(item, **config)
+    monkeypatch.setattr(backend, "configure_item", configure)
+
+    set_write_back(True)
+    broken.width = 10
+    kept.width = 20
+    with pytest.raises(ValueError):
+        flush()
+
+    assert dpg.get_item_configuration(kept.id)["width"] == 20
+    assert write_back_stats()["calls"] == 1
+
+
+def test_start_keeps_the_render_callback_without_frame_callbacks(backend):
+    frames = []
+    dpg.set_render_callback(lambda sender, data: frames.append(sender))
+    window = Window().add()
+    window.end()
+
+    window.start()
+    assert len(frames) == backend.max_frames
+
+
+def test_start_runs_frame_callbacks(backend):
+    frames = []
+    on_frame(lambda: frames.append(None))
+    window = Window().add()
+    window.end()
+
+    window.start()
+    assert len(frames) == backend.max_frames
+
+
+def test_start_leaves_render_callbacks_that_run_frames(backend):
+    frames, user_frames = [], []
+    on_frame(lambda: frames.append(None))
+    def render(sender, data):
+        user_frames.append(None)
+        run_frame()
+
+    dpg.set_render_callback(render)
+    window = Window().add()
+    window.end()
+
+    window.start(run_frames=False)
+    assert len(frames) == len(user_frames) == backend.max_frames